@@ -0,0 +1,54 @@
+"""
+JSON-RPC request handler for the server.
+"""
+
+
+import json
+from xmlrpc.client import Fault
+from xmlrpc.server import SimpleXMLRPCRequestHandler
+
+
+JSON_PATH = '/json'
+
+
+class JSONRPCRequestHandler(SimpleXMLRPCRequestHandler):
+    """
+    Serves JSON-RPC on JSON_PATH and XML-RPC on all other rpc paths.
+    Both protocols use the same registered functions.
+    """
+    rpc_paths = ('/', '/RPC2', JSON_PATH)
+
+    def do_POST(self):
+        """
+        Handles the HTTP POST request.
+        """
+        if self.path != JSON_PATH:
+            super().do_POST()
+            return
+        try:
+            data = self.rfile.read(int(self.headers['content-length']))
+            request = json.loads(data.decode('utf-8'))
+            response = {'id': request.get('id')}
+            try:
+                response['result'] = self.server._dispatch(
+                    request['method'], request.get('params', []))
+            except Fault as error:
+                response['error'] = {
+                    'code': error.faultCode,
+                    'message': error.faultString
+                }
+            except Exception as error:
+                response['error'] = {
+                    'message': '%s:%s' % (type(error).__name__, error)
+                }
+            response = json.dumps(response, ensure_ascii=False).encode('utf-8')
+        except (ValueError, KeyError, TypeError):
+            self.send_response(400)
+            self.send_header('Content-length', '0')
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Content-length', str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
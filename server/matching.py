@@ -0,0 +1,141 @@
+"""
+Matching of answers to short questions.
+
+Correct answer of the question is a list of alternatives separated by ";"
+(use "\\;" to put ";" inside an alternative). Alternative can be:
+    text                 - answer equal to the text;
+    re:pattern           - answer that fully matches the regular expression;
+    num:value+-tolerance - number that differs from value at most by tolerance.
+Any alternative can start with weight in square brackets, for example "[0.5]",
+then the answer gets this share of the score. Answer gets the maximal share of
+matching alternatives, or 0 if none of them match.
+Answers, texts and literal parts of patterns are compared after normalization:
+Unicode NFKC, case folding, "ё" replaced with "е" and all spaces collapsed.
+"""
+
+
+import re
+import math
+import functools
+import unicodedata
+
+
+MATCHERS_CACHE_SIZE = 1024
+SEPARATOR = re.compile(r'(?<!\\);')
+WEIGHT = re.compile(r'\[\s*([0-9]*[.,]?[0-9]+)\s*\]')
+TOLERANCE = re.compile(r'\+-|±')
+SYNTAX = re.compile(
+    r'(\\.|\(\?P<\w+>|\(\?P=\w+\)|\(\?[aiLmsux-]+[:)])', re.DOTALL)
+
+
+def normalize(text):
+    """
+    Returns text in the form it is compared in.
+    """
+    text = unicodedata.normalize('NFKC', text).casefold().replace('ё', 'е')
+    return ' '.join(text.split())
+
+
+def parse_number(text):
+    """
+    Returns number written in the text or None.
+    Both "." and "," are accepted as decimal separators.
+    """
+    try:
+        number = float(text.replace(' ', '').replace(',', '.'))
+    except ValueError:
+        return None
+    if not math.isfinite(number):
+        return None
+    return number
+
+
+def normalize_pattern(pattern):
+    """
+    Returns pattern for normalized answers: its literal text is normalized like answers,
+    escape sequences (for example "\\D" or "\\ "), group names and flags are kept as they are.
+    """
+    parts = SYNTAX.split(unicodedata.normalize('NFKC', pattern))
+    for index in range(0, len(parts), 2):
+        parts[index] = re.sub(r'\s+', ' ', parts[index].casefold().replace('ё', 'е'))
+    parts[0] = parts[0].lstrip()
+    parts[-1] = parts[-1].rstrip()
+    return ''.join(parts)
+
+
+def regex_matcher(pattern):
+    """
+    Returns function that checks that the normalized answer fully matches the pattern.
+    Invalid pattern does not match any answer.
+    """
+    try:
+        regex = re.compile(normalize_pattern(pattern), re.IGNORECASE)
+    except re.error:
+        return lambda answer: False
+    return lambda answer: regex.fullmatch(answer) is not None
+
+
+def number_matcher(text):
+    """
+    Returns function that checks that the answer is a number close to the value.
+    Invalid value does not match any answer.
+    """
+    parts = TOLERANCE.split(text, 1)
+    value = parse_number(parts[0])
+    tolerance = parse_number(parts[1]) if len(parts) > 1 else 0
+    if value is None or tolerance is None:
+        return lambda answer: False
+    tolerance = abs(tolerance)
+
+    def match(answer):
+        number = parse_number(answer)
+        return number is not None and abs(number - value) <= tolerance + 1e-9 * abs(value)
+    return match
+
+
+def parse_alternative(alternative):
+    """
+    Returns weight, kind ("text", "re" or "num") and body of the alternative.
+    """
+    alternative = alternative.replace('\\;', ';').strip()
+    weight = 1
+    found = WEIGHT.match(alternative)
+    if found:
+        weight = min(1, float(found.group(1).replace(',', '.')))
+        alternative = alternative[found.end():].strip()
+    for kind in ('re', 'num'):
+        if alternative.startswith(kind + ':'):
+            return weight, kind, alternative[len(kind) + 1:].strip()
+    return weight, 'text', normalize(alternative)
+
+
+@functools.lru_cache(maxsize=MATCHERS_CACHE_SIZE)
+def compile_matcher(correct):
+    """
+    Returns function that returns share of the normalized answer.
+    Matchers are compiled once for each correct answer: texts are looked up in a dict,
+    patterns are checked in order of decreasing weight and only while they can give more.
+    """
+    texts = {}
+    patterns = []
+    for alternative in SEPARATOR.split(correct):
+        if not alternative.strip():
+            continue
+        weight, kind, body = parse_alternative(alternative)
+        if kind == 'text':
+            texts[body] = max(weight, texts.get(body, 0))
+        elif kind == 're':
+            patterns.append((weight, regex_matcher(body)))
+        else:
+            patterns.append((weight, number_matcher(body)))
+    patterns.sort(key=lambda pattern: -pattern[0])
+
+    def match(answer):
+        share = texts.get(answer, 0)
+        for weight, matcher in patterns:
+            if weight <= share:
+                break
+            if matcher(answer):
+                return weight
+        return share
+    return match
@@ -1,53 +1,22 @@
 """
-Rebuilds database: deletes old database.db and creates tables.
+Rebuilds database: deletes old database.db and archive.db and creates tables.
 """
 
 
 import os
 import sqlite3
+from schema import migrate
 
 
 os.remove('database.db')
+if os.path.exists('archive.db'):
+    os.remove('archive.db')
 CONNECTION = sqlite3.connect('database.db')
 CONNECTION.row_factory = sqlite3.Row
 CURSOR = CONNECTION.cursor()
+CURSOR.execute("ATTACH DATABASE 'archive.db' AS archive")
 
-CURSOR.execute(
-    """
-    CREATE TABLE groups
-    (name text)
-    """
-)
-CURSOR.execute(
-    """
-    CREATE TABLE users
-    (name text, password text, is_admin integer, group_id integer)
-    """
-)
-CURSOR.execute(
-    """
-    CREATE TABLE exams
-    (name text, duration integer, published integer, group_id integer)
-    """
-)
-CURSOR.execute(
-    """
-    CREATE TABLE questions
-    (type text, statement text, correct text, maxsubs integer, maxscore integer, exam_id integer)
-    """
-)
-CURSOR.execute(
-    """
-    CREATE TABLE examrequests
-    (student_id integer, exam_id integer, start integer, end integer)
-    """
-)
-CURSOR.execute(
-    """
-    CREATE TABLE submissions
-    (student_id integer, exam_id integer, question_id integer, answer text, share real)
-    """
-)
+migrate(CURSOR)
 
 # CURSOR.execute(
 #     "INSERT INTO groups VALUES ('m20')"
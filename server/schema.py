@@ -0,0 +1,57 @@
+"""
+Contains schema of the database and migration of databases created by older versions.
+"""
+
+
+TABLES = {
+    'groups': '(name text)',
+    'users': '(name text, password text, is_admin integer, group_id integer)',
+    'exams': '(name text, duration integer, published integer, group_id integer, '
+             'deleted integer DEFAULT 0, archived integer DEFAULT 0)'
+}
+# Archived exams keep their data in the same tables of archive.db.
+ARCHIVED_TABLES = {
+    'questions': '(type text, statement text, correct text, maxsubs integer, maxscore integer, '
+                 'exam_id integer)',
+    'examrequests': '(student_id integer, exam_id integer, start integer, end integer)',
+    'submissions': '(student_id integer, exam_id integer, question_id integer, answer text, '
+                   'share real, request_key text)'
+}
+COLUMNS = [
+    ('main', 'exams', 'deleted', 'integer DEFAULT 0'),
+    ('main', 'exams', 'archived', 'integer DEFAULT 0'),
+    ('main', 'submissions', 'request_key', 'text'),
+    ('archive', 'submissions', 'request_key', 'text')
+]
+INDEXES = [
+    ('INDEX', 'main.groups_name ON groups (name)'),
+    ('INDEX', 'main.users_name ON users (name)'),
+    ('INDEX', 'main.exams_group_id ON exams (group_id)')
+]
+for SCHEMA in ('main', 'archive'):
+    INDEXES += [
+        ('INDEX', SCHEMA + '.questions_exam_id ON questions (exam_id)'),
+        ('INDEX', SCHEMA + '.examrequests_exam_id ON examrequests (exam_id)'),
+        ('INDEX', SCHEMA + '.submissions_exam_id ON submissions (exam_id)'),
+        ('INDEX', SCHEMA + '.submissions_question_id ON submissions (question_id, student_id)'),
+        ('UNIQUE INDEX', SCHEMA + '.submissions_request_key ON submissions (student_id, request_key)')
+    ]
+
+def migrate(cursor):
+    """
+    Creates missing tables, columns and indexes, existing data is kept.
+    Databases main and archive must be attached to the cursor's connection.
+    """
+    for table, columns in TABLES.items():
+        cursor.execute("CREATE TABLE IF NOT EXISTS main." + table + " " + columns)
+    for schema in ('main', 'archive'):
+        for table, columns in ARCHIVED_TABLES.items():
+            cursor.execute("CREATE TABLE IF NOT EXISTS " + schema + "." + table + " " + columns)
+    for schema, table, column, column_type in COLUMNS:
+        cursor.execute("PRAGMA " + schema + ".table_info(" + table + ")")
+        if column not in [row[1] for row in cursor.fetchall()]:
+            cursor.execute(
+                "ALTER TABLE " + schema + "." + table + " ADD COLUMN " + column + " " + column_type)
+    for kind, index in INDEXES:
+        cursor.execute("CREATE " + kind + " IF NOT EXISTS " + index)
+    cursor.connection.commit()
@@ -3,9 +3,18 @@ Examiner project, server module.
 """
 
 
+import io
+import csv
 import sqlite3
+import secrets
+import itertools
+from collections import OrderedDict
+from xmlrpc.client import Fault
 from xmlrpc.server import SimpleXMLRPCServer
-from time import time
+from time import time, perf_counter
+from jsonrpc import JSONRPCRequestHandler
+from matching import normalize, compile_matcher
+from schema import migrate
 
 
 def ping():
@@ -15,6 +24,13 @@ def ping():
     return True
 
 
+def server_time():
+    """
+    Returns current time of the server in seconds, clients use it to correct their clocks.
+    """
+    return time()
+
+
 def get_last(data):
     """
     Returns dict(data[-1]) if data else False
@@ -22,6 +38,71 @@ def get_last(data):
     return dict(data[-1]) if data else False
 
 
+def create_session(user):
+    """
+    Creates session of the user and returns its token.
+    """
+    token = secrets.token_hex(16)
+    SESSIONS[token] = {'user': user, 'expires': time() + SESSION_LIFETIME}
+    return token
+
+
+def get_session_user(token):
+    """
+    Returns user of the session with token.
+    Raises Fault with INVALID_SESSION code if there is no such session,
+    so clients can log in again instead of treating it as missing data.
+    """
+    session = SESSIONS.get(token)
+    if session is not None and session['expires'] < time():
+        del SESSIONS[token]
+        session = None
+    if session is None:
+        raise Fault(INVALID_SESSION, 'Сессия недействительна')
+    session['expires'] = time() + SESSION_LIFETIME
+    return session['user']
+
+
+def get_admin_user(token):
+    """
+    Returns user of the session with token.
+    Raises Fault with ACCESS_DENIED code if the user is not a teacher.
+    """
+    user = get_session_user(token)
+    if not user['is_admin']:
+        raise Fault(ACCESS_DENIED, 'Недостаточно прав')
+    return user
+
+
+def expire_sessions():
+    """
+    Deletes expired sessions.
+    """
+    now = time()
+    for token in [token for token, session in SESSIONS.items() if session['expires'] < now]:
+        del SESSIONS[token]
+
+
+def exam_schema(exam_id):
+    """
+    Returns name of the database ('main' or 'archive') that contains
+    questions, requests and submissions of the exam.
+    """
+    CURSOR.execute(
+        "SELECT archived FROM exams WHERE rowid=?",
+        (exam_id,)
+    )
+    exam = get_last(CURSOR.fetchall())
+    return 'archive' if exam and exam['archived'] else 'main'
+
+
+def row_schema(row_id):
+    """
+    Returns name of the database that contains the question or the submission with row_id.
+    """
+    return 'archive' if row_id >= ARCHIVE_ID_OFFSET else 'main'
+
+
 def create_group(group_name):
     """
     Creates the group.
@@ -71,6 +152,46 @@ def register(user_name, password, is_admin, group_name):
     return (True, '')
 
 
+def register_many(users, is_admin, group_name, token):
+    """
+    Registers users, given as list of [user_name, password], in one transaction.
+    Returns list of [index, message] for users that were not registered.
+    """
+    get_admin_user(token)
+    CURSOR.execute(
+        "SELECT rowid, * FROM groups WHERE name=?",
+        (group_name,)
+    )
+    group = get_last(CURSOR.fetchall())
+    if group is False:
+        return (False, 'Неверное название группы')
+    names = list({user[0] for user in users})
+    existing = set()
+    for i in range(0, len(names), 500):
+        chunk = names[i:i + 500]
+        CURSOR.execute(
+            "SELECT name FROM users WHERE name IN (" + ','.join('?' * len(chunk)) + ")",
+            chunk
+        )
+        existing.update(user['name'] for user in CURSOR.fetchall())
+    conflicts = []
+    rows = []
+    for index, (user_name, password) in enumerate(users):
+        if not user_name:
+            conflicts.append([index, 'Пустое имя пользователя'])
+        elif user_name in existing:
+            conflicts.append([index, 'Такой пользователь уже есть'])
+        else:
+            existing.add(user_name)
+            rows.append((user_name, password, is_admin, group['rowid']))
+    CURSOR.executemany(
+        "INSERT INTO users VALUES (?, ?, ?, ?)",
+        rows
+    )
+    CONNECTION.commit()
+    return (True, conflicts)
+
+
 def login(user_name, password, is_admin):
     """
     Tries to login the user.
@@ -82,27 +203,33 @@ def login(user_name, password, is_admin):
     user = get_last(CURSOR.fetchall())
     if user is False or user['password'] != password or user['is_admin'] != is_admin:
         return (False, 'Неудачный вход')
+    user['token'] = create_session(user)
     return (True, user)
 
 
-def change_password(user_id, old_password, new_password):
+def logout(token):
+    """
+    Closes the session.
+    """
+    SESSIONS.pop(token, None)
+    return True
+
+
+def change_password(token, old_password, new_password):
     """
     Tries to change old_password to new_password of the user.
     """
-    CURSOR.execute(
-        "SELECT * FROM users WHERE rowid=?",
-        (user_id,)
-    )
-    user = get_last(CURSOR.fetchall())
-    if user is False:
-        return (False, 'Неверный пользователь')
+    user = get_session_user(token)
     if user['password'] != old_password:
         return (False, 'Неправильный пароль')
     CURSOR.execute(
         "UPDATE users SET password=? WHERE rowid=?",
-        (new_password, user_id)
+        (new_password, user['rowid'])
     )
     CONNECTION.commit()
+    for session_token in [session_token for session_token, session in SESSIONS.items()
+                          if session['user']['rowid'] == user['rowid']]:
+        del SESSIONS[session_token]
     return (True, '')
 
 
@@ -122,120 +249,351 @@ def list_of_published_exams(group_id):
     Returns list of all published exams in the group.
     """
     CURSOR.execute(
-        "SELECT rowid, name FROM exams WHERE published=1 AND group_id=?",
+        "SELECT rowid, name FROM exams WHERE published=1 AND deleted=0 AND group_id=?",
         (group_id,)
     )
     exams = CURSOR.fetchall()
     return [dict(exam) for exam in exams]
 
 
-def list_of_all_exams(group_id):
+def list_of_all_exams(group_id, token):
     """
     Returns list of all exams in the group.
     """
+    get_admin_user(token)
     CURSOR.execute(
-        "SELECT rowid, name FROM exams WHERE group_id=?",
+        "SELECT rowid, name FROM exams WHERE deleted=0 AND group_id=?",
         (group_id,)
     )
     exams = CURSOR.fetchall()
     return [dict(exam) for exam in exams]
 
 
-def create_exam(group_id):
+def casefold(text):
+    """
+    Returns casefolded text, registered in sqlite to compare names ignoring case in any language.
+    """
+    return text.casefold() if isinstance(text, str) else text
+
+
+def like_pattern(text):
+    """
+    Returns LIKE pattern matching casefolded strings that contain text.
+    """
+    text = casefold(text).replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return '%' + text + '%'
+
+
+def get_exams_page(group_id, published_only, cursor, limit, name_filter):
+    """
+    Returns at most limit exams in the group with rowid greater than cursor,
+    whose name contains name_filter, and the cursor of the next page.
+    """
+    condition = "group_id=? AND deleted=0 AND casefold(name) LIKE ? ESCAPE '\\'"
+    if published_only:
+        condition += " AND published=1"
+    CURSOR.execute(
+        "SELECT COUNT(*) FROM exams WHERE " + condition,
+        (group_id, like_pattern(name_filter))
+    )
+    total = CURSOR.fetchone()[0]
+    CURSOR.execute(
+        "SELECT rowid, name FROM exams WHERE " + condition +
+        " AND rowid>? ORDER BY rowid LIMIT ?",
+        (group_id, like_pattern(name_filter), cursor, limit)
+    )
+    exams = [dict(exam) for exam in CURSOR.fetchall()]
+    return {
+        'exams': exams,
+        'cursor': exams[-1]['rowid'] if len(exams) == limit else False,
+        'total': total
+    }
+
+
+def create_exam(group_id, token):
     """
     Creates the exam.
     """
+    get_admin_user(token)
     CURSOR.execute(
-        "INSERT INTO exams VALUES ('', 45, 0, ?)",
+        "INSERT INTO exams VALUES ('', 45, 0, ?, 0, 0)",
         (group_id,)
     )
     CONNECTION.commit()
     return CURSOR.lastrowid
 
 
-def delete_exam(exam_id):
+def delete_exam(exam_id, token):
+    """
+    Marks the exam as deleted. Its data is purged later by purge_deleted_exams.
+    """
+    global PURGE_PENDING
+    get_admin_user(token)
+    drop_judge_memos(exam_id)
+    CURSOR.execute(
+        "UPDATE exams SET deleted=1 WHERE rowid=?",
+        (exam_id,)
+    )
+    CONNECTION.commit()
+    PURGE_PENDING = True
+    return True
+
+
+def purge_deleted_exams():
     """
-    Deletes the exam.
+    Deletes at most PURGE_CHUNK_SIZE rows of one deleted exam in a short transaction.
+    Returns False if there is nothing to purge.
     """
+    global PURGE_PENDING
+    if not PURGE_PENDING:
+        return False
+    CURSOR.execute(
+        "SELECT rowid, archived FROM exams WHERE deleted=1 LIMIT 1"
+    )
+    exam = get_last(CURSOR.fetchall())
+    if exam is False:
+        PURGE_PENDING = False
+        return False
+    schema = 'archive' if exam['archived'] else 'main'
+    for table in ('submissions', 'examrequests', 'questions'):
+        table = schema + '.' + table
+        CURSOR.execute(
+            "DELETE FROM " + table + " WHERE rowid IN " +
+            "(SELECT rowid FROM " + table + " WHERE exam_id=? LIMIT ?)",
+            (exam['rowid'], PURGE_CHUNK_SIZE)
+        )
+        if CURSOR.rowcount > 0:
+            CONNECTION.commit()
+            return True
     CURSOR.execute(
         "DELETE FROM exams WHERE rowid=?",
+        (exam['rowid'],)
+    )
+    CONNECTION.commit()
+    return True
+
+
+def export_exam(exam_id, token):
+    """
+    Returns bundle with exam settings and all questions of the exam.
+    """
+    get_admin_user(token)
+    exam_data = load_exam_data(exam_id)
+    if not exam_data:
+        return False
+    CURSOR.execute(
+        "SELECT type, statement, correct, maxsubs, maxscore FROM " +
+        exam_schema(exam_id) + ".questions WHERE exam_id=? ORDER BY rowid",
         (exam_id,)
     )
+    return {
+        'version': 1,
+        'exam': {
+            'name': exam_data['name'],
+            'duration': exam_data['duration']
+        },
+        'questions': [dict(question) for question in CURSOR.fetchall()]
+    }
+
+
+def import_exam(group_id, bundle, token):
+    """
+    Creates unpublished exam with all questions from the bundle in one transaction.
+    """
+    get_admin_user(token)
+    try:
+        questions = [
+            (question['type'], question['statement'], question['correct'],
+             int(question['maxsubs']), int(question['maxscore']))
+            for question in bundle['questions']
+        ]
+        if any(question[0] not in ('Short', 'Long') for question in questions):
+            return (False, 'Неизвестный тип вопроса')
+        CURSOR.execute(
+            "INSERT INTO exams VALUES (?, ?, 0, ?, 0, 0)",
+            (bundle['exam']['name'], int(bundle['exam']['duration']), group_id)
+        )
+        exam_id = CURSOR.lastrowid
+        CURSOR.executemany(
+            "INSERT INTO questions VALUES (?, ?, ?, ?, ?, ?)",
+            [question + (exam_id,) for question in questions]
+        )
+    except (KeyError, TypeError, ValueError, sqlite3.Error):
+        CONNECTION.rollback()
+        return (False, 'Неверный формат экзамена')
+    CONNECTION.commit()
+    return (True, exam_id)
+
+
+def clone_exam(exam_id, group_name, token):
+    """
+    Copies the exam with all questions to the group with group_name
+    (or to the same group, if group_name is empty) and returns the copy's id.
+    """
+    get_admin_user(token)
+    exam_data = load_exam_data(exam_id)
+    if not exam_data:
+        return (False, 'Экзамен не найден')
+    group_id = exam_data['group_id']
+    if group_name:
+        CURSOR.execute(
+            "SELECT rowid FROM groups WHERE name=?",
+            (group_name,)
+        )
+        group = get_last(CURSOR.fetchall())
+        if group is False:
+            return (False, 'Неверное название группы')
+        group_id = group['rowid']
     CURSOR.execute(
-        "DELETE FROM questions WHERE exam_id=?",
+        "INSERT INTO exams SELECT name || ' (копия)', duration, 0, ?, 0, 0 FROM exams WHERE rowid=?",
+        (group_id, exam_id)
+    )
+    clone_id = CURSOR.lastrowid
+    CURSOR.execute(
+        "INSERT INTO main.questions SELECT type, statement, correct, maxsubs, maxscore, ? "
+        "FROM " + exam_schema(exam_id) + ".questions WHERE exam_id=? ORDER BY rowid",
+        (clone_id, exam_id)
+    )
+    CONNECTION.commit()
+    return (True, clone_id)
+
+
+def archive_exam(exam_id, token):
+    """
+    Moves questions, requests and submissions of the finished exam to the archive database.
+    The exam stays in the list of exams and becomes read-only, except for the published flag.
+    """
+    get_admin_user(token)
+    exam_data = load_exam_data(exam_id)
+    if not exam_data or exam_data['archived']:
+        return (False, 'Экзамен не найден')
+    CURSOR.execute(
+        "SELECT rowid FROM examrequests WHERE exam_id=? AND end>? LIMIT 1",
+        (exam_id, time())
+    )
+    if CURSOR.fetchall():
+        return (False, 'Не все участники завершили экзамен')
+    CURSOR.execute(
+        "SELECT rowid FROM submissions WHERE exam_id=? AND share=-1 LIMIT 1",
         (exam_id,)
     )
+    if CURSOR.fetchall():
+        return (False, 'Есть непроверенные ответы')
+    drop_judge_memos(exam_id)
     CURSOR.execute(
-        "DELETE FROM examrequests WHERE exam_id=?",
+        "INSERT INTO archive.questions (rowid, type, statement, correct, maxsubs, maxscore, exam_id) "
+        "SELECT rowid + ?, type, statement, correct, maxsubs, maxscore, exam_id "
+        "FROM main.questions WHERE exam_id=?",
+        (ARCHIVE_ID_OFFSET, exam_id)
+    )
+    CURSOR.execute(
+        "INSERT INTO archive.examrequests SELECT * FROM main.examrequests WHERE exam_id=?",
         (exam_id,)
     )
     CURSOR.execute(
-        "DELETE FROM submissions WHERE exam_id=?",
+        "INSERT INTO archive.submissions "
+        "(rowid, student_id, exam_id, question_id, answer, share, request_key) "
+        "SELECT rowid + ?, student_id, exam_id, question_id + ?, answer, share, request_key "
+        "FROM main.submissions WHERE exam_id=?",
+        (ARCHIVE_ID_OFFSET, ARCHIVE_ID_OFFSET, exam_id)
+    )
+    for table in ('questions', 'examrequests', 'submissions'):
+        CURSOR.execute(
+            "DELETE FROM main." + table + " WHERE exam_id=?",
+            (exam_id,)
+        )
+    CURSOR.execute(
+        "UPDATE exams SET archived=1 WHERE rowid=?",
         (exam_id,)
     )
     CONNECTION.commit()
-    return True
+    return (True, '')
 
 
-def start_exam(exam_id, user_id):
+def start_exam(exam_id, token):
     """
     Starts the exam.
     """
-    exam_data = get_exam_data(exam_id)
-    if not exam_data:
+    user = get_session_user(token)
+    exam_data = load_exam_data(exam_id)
+    if not exam_data or exam_data['archived']:
         return False
     CURSOR.execute(
         "INSERT INTO examrequests VALUES (?, ?, ?, ?)",
-        (user_id, exam_id, int(time()), int(time()) + exam_data['duration'] * 60)
+        (user['rowid'], exam_id, int(time()), int(time()) + exam_data['duration'] * 60)
     )
     CONNECTION.commit()
     return True
 
 
-def finish_exam(exam_id, user_id):
+def finish_exam(exam_id, token):
     """
     Finishes the exam.
     """
+    user = get_session_user(token)
     CURSOR.execute(
         "UPDATE examrequests SET end=? WHERE student_id=? AND exam_id=?",
-        (time(), user_id, exam_id)
+        (time(), user['rowid'], exam_id)
     )
     CONNECTION.commit()
     return True
 
 
-def get_users_by_exam(exam_id):
+def load_users_by_exam(exam_id):
     """
-    Returns users that participated in the exam.
+    Returns ids and names of users that participated in the exam.
     """
     CURSOR.execute(
-        "SELECT rowid, * FROM users WHERE rowid IN " +
-        "(SELECT student_id FROM examrequests WHERE exam_id=?)",
+        "SELECT rowid, name FROM users WHERE rowid IN " +
+        "(SELECT student_id FROM " + exam_schema(exam_id) + ".examrequests WHERE exam_id=?)",
         (exam_id,)
     )
     return [dict(user) for user in CURSOR.fetchall()]
 
 
-def get_exam_data(exam_id):
+def get_users_by_exam(exam_id, token):
+    """
+    Returns ids and names of users that participated in the exam, for teachers.
+    """
+    get_admin_user(token)
+    return load_users_by_exam(exam_id)
+
+
+def load_exam_data(exam_id):
     """
     Returns exam data.
     """
     CURSOR.execute(
-        "SELECT rowid, * FROM exams WHERE rowid=?",
+        "SELECT rowid, * FROM exams WHERE rowid=? AND deleted=0",
         (exam_id,)
     )
     return get_last(CURSOR.fetchall())
 
 
-def set_exam_data(exam_data):
+def get_exam_data(exam_id, token):
+    """
+    Returns exam data for teachers.
+    """
+    get_admin_user(token)
+    return load_exam_data(exam_id)
+
+
+def set_exam_data(exam_data, token):
     """
     Saves exam data.
+    Only the published flag can be changed for the archived exam.
     """
+    get_admin_user(token)
     CURSOR.execute(
-        "UPDATE exams SET name=?, duration=?, published=? WHERE rowid=?",
+        "UPDATE exams SET name=?, duration=?, published=? "
+        "WHERE rowid=? AND deleted=0 AND archived=0",
         (exam_data['name'], exam_data['duration'],
          exam_data['published'], exam_data['rowid'])
     )
+    CURSOR.execute(
+        "UPDATE exams SET published=? WHERE rowid=? AND deleted=0 AND archived=1",
+        (exam_data['published'], exam_data['rowid'])
+    )
     CONNECTION.commit()
     return True
 
@@ -245,19 +603,21 @@ def get_questions_ids(exam_id):
     Returns questions' ids in the exam.
     """
     CURSOR.execute(
-        "SELECT rowid FROM questions WHERE exam_id=?",
+        "SELECT rowid FROM " + exam_schema(exam_id) + ".questions WHERE exam_id=? ORDER BY rowid",
         (exam_id,)
     )
     questions = CURSOR.fetchall()
     return [dict(question)['rowid'] for question in questions]
 
 
-def get_question_result(question_id, user_id):
+def load_question_result(question_id, user_id):
     """
     Returns user's result of the question.
     """
     CURSOR.execute(
-        "SELECT rowid, * FROM submissions WHERE student_id=? AND question_id=?",
+        "SELECT rowid, student_id, exam_id, question_id, answer, share " +
+        "FROM " + row_schema(question_id) + ".submissions " +
+        "WHERE student_id=? AND question_id=?",
         (user_id, question_id)
     )
     result = get_last(CURSOR.fetchall())
@@ -270,29 +630,118 @@ def get_question_result(question_id, user_id):
     return result
 
 
-def get_questions_results(exam_id, user_id):
+def get_question_result(question_id, user_id, token):
+    """
+    Returns result of any user for teachers.
+    """
+    get_admin_user(token)
+    return load_question_result(question_id, user_id)
+
+
+def get_user_results(exam_id, user_id):
     """
     Returns user's results of the exam.
     """
-    return [get_question_result(question_id, user_id) for question_id in get_questions_ids(exam_id)]
+    return [load_question_result(question_id, user_id) for question_id in get_questions_ids(exam_id)]
 
 
-def get_results_table(exam_id):
+def get_questions_results(exam_id, token):
+    """
+    Returns results of the exam of the session's user.
+    """
+    user = get_session_user(token)
+    return get_user_results(exam_id, user['rowid'])
+
+
+def get_results_table(exam_id, token):
     """
     Returns results table of the exam.
     """
-    return [get_questions_results(exam_id, user['rowid']) for user in get_users_by_exam(exam_id)]
+    get_admin_user(token)
+    return [get_user_results(exam_id, user['rowid']) for user in load_users_by_exam(exam_id)]
+
+
+def iter_results_rows(exam_id, with_answers, cursor, limit):
+    """
+    Yields (user_id, row) for at most limit users with rowid greater than cursor
+    that participated in the exam, only cells of these users are joined.
+    Row contains user name, score of each question, total score and,
+    if with_answers, last answer of each question.
+    """
+    schema = exam_schema(exam_id)
+    cells = CONNECTION.execute(
+        "SELECT requests.student_id, users.name, questions.maxscore, "
+        "submissions.share, submissions.answer "
+        "FROM (SELECT DISTINCT student_id FROM " + schema + ".examrequests "
+        "WHERE exam_id=? AND student_id>? ORDER BY student_id LIMIT ?) AS requests "
+        "JOIN users ON users.rowid=requests.student_id "
+        "LEFT JOIN " + schema + ".questions AS questions ON questions.exam_id=? "
+        "LEFT JOIN " + schema + ".submissions AS submissions ON submissions.rowid=("
+        "SELECT MAX(rowid) FROM " + schema + ".submissions "
+        "WHERE question_id=questions.rowid AND student_id=requests.student_id) "
+        "ORDER BY requests.student_id, questions.rowid",
+        (exam_id, cursor, limit, exam_id)
+    )
+    for user_id, user_cells in itertools.groupby(cells, key=lambda cell: cell['student_id']):
+        name = None
+        scores = []
+        answers = []
+        total_score = 0
+        for cell in user_cells:
+            name = cell['name']
+            if cell['maxscore'] is None:
+                continue
+            if cell['share'] is None:
+                scores.append('')
+            elif cell['share'] == -1:
+                scores.append('?')
+            else:
+                score = int(cell['maxscore'] * cell['share'])
+                scores.append(score)
+                total_score += score
+            answers.append(cell['answer'] if cell['answer'] is not None else '')
+        row = [name] + scores + [total_score]
+        if with_answers:
+            row += answers
+        yield user_id, row
+
+
+def export_results(exam_id, with_answers, delimiter, cursor, limit, token):
+    """
+    Returns CSV with results of at most limit users after cursor and the cursor of the next chunk.
+    The first chunk (cursor is 0) starts with the header.
+    """
+    get_admin_user(token)
+    output = io.StringIO()
+    writer = csv.writer(output, delimiter=delimiter, lineterminator='\n')
+    if not cursor:
+        cnt_questions = len(get_questions_ids(exam_id))
+        header = ['Участник'] + [str(i + 1) for i in range(cnt_questions)] + ['Σ']
+        if with_answers:
+            header += ['Ответ ' + str(i + 1) for i in range(cnt_questions)]
+        writer.writerow(header)
+    count = 0
+    for user_id, row in iter_results_rows(exam_id, with_answers, cursor, limit):
+        writer.writerow(row)
+        cursor = user_id
+        count += 1
+    return {
+        'data': output.getvalue(),
+        'cursor': cursor if count == limit else False
+    }
 
 
-def get_exam_data_student(exam_id, user_id):
+def get_exam_data_student(exam_id, token):
     """
     Returns exam data for student.
     """
-    exam_data = get_exam_data(exam_id)
+    user = get_session_user(token)
+    exam_data = load_exam_data(exam_id)
     if not exam_data:
         return False
+    user_id = user['rowid']
     CURSOR.execute(
-        "SELECT * FROM examrequests WHERE student_id=? AND exam_id=?",
+        "SELECT * FROM " + exam_schema(exam_id) + ".examrequests WHERE student_id=? AND exam_id=?",
         (user_id, exam_id)
     )
     request = get_last(CURSOR.fetchall())
@@ -307,7 +756,7 @@ def get_exam_data_student(exam_id, user_id):
     total_score = 0
     total_maxscore = 0
     for question_id in get_questions_ids(exam_id):
-        result = get_question_result(question_id, user_id)
+        result = load_question_result(question_id, user_id)
         maxscore = get_question_data(question_id)['maxscore']
         score = result['score'] if result else 0
         total_maxscore += maxscore
@@ -322,10 +771,13 @@ def get_exam_data_student(exam_id, user_id):
     }
 
 
-def create_question(exam_id, question_type):
+def create_question(exam_id, question_type, token):
     """
     Creates question of the exam.
     """
+    get_admin_user(token)
+    if exam_schema(exam_id) == 'archive':
+        return False
     maxsubs = 1 if question_type == 'Short' else 1000
     CURSOR.execute(
         "INSERT INTO questions VALUES (?, '', '', ?, 1, ?)",
@@ -335,10 +787,14 @@ def create_question(exam_id, question_type):
     return CURSOR.lastrowid
 
 
-def delete_question(question_id):
+def delete_question(question_id, token):
     """
     Deletes question.
     """
+    get_admin_user(token)
+    if row_schema(question_id) == 'archive':
+        return False
+    JUDGE_MEMO.pop(question_id, None)
     CURSOR.execute(
         "DELETE FROM questions WHERE rowid=?",
         (question_id,)
@@ -356,16 +812,30 @@ def get_question_data(question_id):
     Returns question data.
     """
     CURSOR.execute(
-        "SELECT rowid, * FROM questions WHERE rowid=?",
+        "SELECT rowid, * FROM " + row_schema(question_id) + ".questions WHERE rowid=?",
         (question_id,)
     )
     return get_last(CURSOR.fetchall())
 
 
-def set_question_data(question_data):
+def get_questions_data(exam_id):
+    """
+    Returns data of all questions in the exam, in the same order as get_questions_ids.
+    """
+    CURSOR.execute(
+        "SELECT rowid, * FROM " + exam_schema(exam_id) + ".questions WHERE exam_id=? ORDER BY rowid",
+        (exam_id,)
+    )
+    return [dict(question) for question in CURSOR.fetchall()]
+
+
+def set_question_data(question_data, token):
     """
     Saves question data.
     """
+    get_admin_user(token)
+    if row_schema(question_data['rowid']) == 'archive':
+        return False
     CURSOR.execute(
         "UPDATE questions SET type=?, statement=?, correct=?, maxsubs=?, maxscore=? WHERE rowid=?",
         (question_data['type'], question_data['statement'], question_data['correct'],
@@ -373,26 +843,41 @@ def set_question_data(question_data):
          question_data['rowid'])
     )
     CONNECTION.commit()
+    JUDGE_MEMO.pop(question_data['rowid'], None)
     return True
 
 
-def add_submission(exam_id, question_id, submission_text, user_id):
+def add_submission(exam_id, question_id, submission_text, token, request_key=''):
     """
     Adds submission with submission_text.
+    Repeated call with the same non-empty request_key does not add the submission again
+    and returns True, so clients can safely retry.
     """
+    user = get_session_user(token)
     question_data = get_question_data(question_id)
-    if not question_data or not submission_text:
+    if not question_data or not submission_text or row_schema(question_id) == 'archive':
         return False
+    user_id = user['rowid']
+    if request_key:
+        CURSOR.execute(
+            "SELECT rowid FROM submissions WHERE student_id=? AND request_key=?",
+            (user_id, request_key)
+        )
+        if CURSOR.fetchall():
+            return True
     CURSOR.execute(
         "SELECT * FROM submissions WHERE student_id=? AND question_id=?",
         (user_id, question_id)
     )
     if len(CURSOR.fetchall()) >= question_data['maxsubs']:
         return False
-    CURSOR.execute(
-        "INSERT INTO submissions VALUES (?, ?, ?, ?, -1)",
-        (user_id, exam_id, question_id, submission_text)
-    )
+    try:
+        CURSOR.execute(
+            "INSERT INTO submissions VALUES (?, ?, ?, ?, -1, ?)",
+            (user_id, exam_id, question_id, submission_text, request_key or None)
+        )
+    except sqlite3.IntegrityError:
+        return True
     CONNECTION.commit()
     judge_submission(CURSOR.lastrowid)
     return True
@@ -424,10 +909,13 @@ def judge_submission(submission_id):
     return True
 
 
-def save_submission_score(submission_id, share):
+def save_submission_score(submission_id, share, token):
     """
     Saves share of the submission.
     """
+    get_admin_user(token)
+    if row_schema(submission_id) == 'archive':
+        return False
     CURSOR.execute(
         "UPDATE submissions SET share=? WHERE rowid=?",
         (share, submission_id)
@@ -436,17 +924,42 @@ def save_submission_score(submission_id, share):
     return True
 
 
-def judge_short(submission, question_data):
+def judge_memo(question_data):
     """
-    Judges short question.
+    Returns memo of the question that maps normalized answer to share.
+    Memo is shared by all students and is dropped if the correct answer has changed.
+    Only memos of JUDGE_MEMO_QUESTIONS recently judged questions are kept.
     """
-    share = -1
-    correct_list = question_data['correct'].split(';')
-    correct_list = [s.lower().strip() for s in correct_list]
-    if submission['answer'].lower().strip() in correct_list:
-        share = 1
+    memo = JUDGE_MEMO.get(question_data['rowid'])
+    if memo is None or memo[0] != question_data['correct']:
+        memo = (question_data['correct'], {})
+        JUDGE_MEMO[question_data['rowid']] = memo
+        if len(JUDGE_MEMO) > JUDGE_MEMO_QUESTIONS:
+            JUDGE_MEMO.popitem(last=False)
     else:
-        share = 0
+        JUDGE_MEMO.move_to_end(question_data['rowid'])
+    return memo[1]
+
+
+def drop_judge_memos(exam_id):
+    """
+    Drops memos of questions of the exam, call before its questions are moved or deleted.
+    """
+    for question_id in get_questions_ids(exam_id):
+        JUDGE_MEMO.pop(question_id, None)
+
+
+def judge_short(submission, question_data):
+    """
+    Judges short question, each distinct answer is judged once.
+    """
+    answer = normalize(submission['answer'])
+    memo = judge_memo(question_data)
+    if answer in memo:
+        return memo[answer]
+    share = compile_matcher(question_data['correct'])(answer)
+    if len(memo) < JUDGE_MEMO_SIZE:
+        memo[answer] = share
     return share
 
 
@@ -457,22 +970,64 @@ def judge_long(submission_text, question_data):
     return -1
 
 
+class ExamServer(SimpleXMLRPCServer):
+    """
+    Server that purges deleted exams and expired sessions between requests.
+    """
+    last_expire = 0
+
+    def service_actions(self):
+        """
+        Purges deleted exams in chunks for at most PURGE_TIME_LIMIT seconds
+        and deletes expired sessions once a minute.
+        """
+        start = perf_counter()
+        while perf_counter() - start < PURGE_TIME_LIMIT and purge_deleted_exams():
+            pass
+        if time() - self.last_expire > 60:
+            expire_sessions()
+            self.last_expire = time()
+
+
+PURGE_CHUNK_SIZE = 500
+PURGE_TIME_LIMIT = 0.01
+PURGE_PENDING = True
+ARCHIVE_ID_OFFSET = 2 ** 30
+SESSION_LIFETIME = 12 * 60 * 60
+INVALID_SESSION = 2
+ACCESS_DENIED = 3
+SESSIONS = {}
+JUDGE_MEMO_SIZE = 10000
+JUDGE_MEMO_QUESTIONS = 256
+JUDGE_MEMO = OrderedDict()
+
 CONNECTION = sqlite3.connect('database.db')
 CONNECTION.row_factory = sqlite3.Row
+CONNECTION.create_function('casefold', 1, casefold, deterministic=True)
 CURSOR = CONNECTION.cursor()
+CURSOR.execute("ATTACH DATABASE 'archive.db' AS archive")
+migrate(CURSOR)
 
-SERVER = SimpleXMLRPCServer(('', 8000))
+SERVER = ExamServer(('', 8000), requestHandler=JSONRPCRequestHandler)
 
 SERVER.register_function(ping)
+SERVER.register_function(server_time)
 SERVER.register_function(create_group)
 SERVER.register_function(register)
+SERVER.register_function(register_many)
 SERVER.register_function(login)
+SERVER.register_function(logout)
 SERVER.register_function(change_password)
 SERVER.register_function(get_group_data)
 SERVER.register_function(list_of_published_exams)
 SERVER.register_function(list_of_all_exams)
+SERVER.register_function(get_exams_page)
 SERVER.register_function(create_exam)
 SERVER.register_function(delete_exam)
+SERVER.register_function(export_exam)
+SERVER.register_function(import_exam)
+SERVER.register_function(clone_exam)
+SERVER.register_function(archive_exam)
 SERVER.register_function(start_exam)
 SERVER.register_function(finish_exam)
 SERVER.register_function(get_users_by_exam)
@@ -482,12 +1037,14 @@ SERVER.register_function(get_questions_ids)
 SERVER.register_function(get_question_result)
 SERVER.register_function(get_questions_results)
 SERVER.register_function(get_results_table)
+SERVER.register_function(export_results)
 SERVER.register_function(get_exam_data_student)
 SERVER.register_function(create_question)
 SERVER.register_function(delete_question)
 SERVER.register_function(get_question_data)
+SERVER.register_function(get_questions_data)
 SERVER.register_function(set_question_data)
 SERVER.register_function(add_submission)
 SERVER.register_function(save_submission_score)
 
-SERVER.serve_forever()
+SERVER.serve_forever(poll_interval=0.1)
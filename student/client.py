@@ -3,10 +3,21 @@ Contains client settings and server.
 """
 
 
-import json
 import socket
 import hashlib
-from xmlrpc.client import ServerProxy
+import threading
+from time import time, monotonic, perf_counter
+from config import Config
+from transport import ServerTransport, CircuitBreaker
+
+
+CLOCK_SAMPLES = 5
+CACHE_TTL = {
+    'get_group_data': 600,
+    'list_of_published_exams': 30,
+    'get_exams_page': 60,
+    'get_questions_ids': 60
+}
 
 
 class Client:
@@ -15,13 +26,21 @@ class Client:
     """
     def __init__(self):
         self.path = 'client//settings.json'
+        self.config = Config(self.path)
         self.user = False
         # self.user_name = 'Фёдор Куянов'
         # self.password = '12345'
         self.user_name = ''
         self.password = ''
         self.salt = ':sdg436fregak'
-        self.server = None
+        self.server_data = None
+        self.breaker = None
+        self.on_retry = lambda: None
+        self.server_version = 0
+        self.local = threading.local()
+        self.cache = {}
+        self.cache_version = 0
+        self.clock_offset = 0
         self.update_server()
 
     def encode_password(self, password):
@@ -32,30 +51,105 @@ class Client:
 
     def get_data(self):
         """
-        Returns json data.
+        Returns settings.
         """
-        return json.load(open(self.path, 'r'))
+        return dict(self.config.data)
 
-    def set_data(self, data):
+    def update_data(self, data):
         """
-        Assigns json data to data.
+        Updates settings, returns True if they changed.
         """
-        json.dump(data, open(self.path, 'w'), indent=4)
+        return self.config.update(data)
 
-    def update_data(self, data):
+    def reload_data(self):
+        """
+        Reloads settings edited by another program, the server is updated if it changed.
+        """
+        if not self.config.reload():
+            return
+        data = self.get_data()
+        for key in ('server', 'protocol'):
+            if data.get(key) != self.server_data.get(key):
+                self.update_server()
+                return
+
+    def server_time(self):
+        """
+        Returns estimated current time of the server.
+        """
+        return time() + self.clock_offset
+
+    def get_cached(self, method, args):
+        """
+        Returns pair (found, result) for the cached call.
+        """
+        key = (method, tuple(args))
+        if key in self.cache:
+            expires, result = self.cache[key]
+            if monotonic() < expires:
+                return True, result
+            del self.cache[key]
+        return False, None
+
+    def set_cached(self, method, args, result):
         """
-        Updates json data.
+        Saves result of the call if the method is cacheable.
         """
-        current_data = self.get_data()
-        for key, value in data.items():
-            current_data[key] = value
-        self.set_data(current_data)
+        if method in CACHE_TTL:
+            self.cache[(method, tuple(args))] = (monotonic() + CACHE_TTL[method], result)
+
+    def invalidate(self, *methods):
+        """
+        Drops cached results of methods, all results if methods are not given.
+        """
+        self.cache_version += 1
+        for key in list(self.cache):
+            if not methods or key[0] in methods:
+                del self.cache[key]
+
+    def make_server(self):
+        """
+        Returns new server proxy.
+        """
+        return ServerTransport(
+            self.server_data['server'], self.server_data.get('protocol', 'xml'),
+            self.breaker, lambda: self.on_retry())
 
     def update_server(self):
         """
-        Updates self.server.
+        Applies new server settings, proxies of threads are recreated on the next call.
         """
-        self.server = ServerProxy('http://' + self.get_data()['server'])
+        self.server_data = self.get_data()
+        self.server_version += 1
+        self.breaker = CircuitBreaker()
+        self.invalidate()
+
+    def thread_server(self):
+        """
+        Returns server proxy of the current thread, proxies are not thread-safe.
+        """
+        if getattr(self.local, 'server_version', None) != self.server_version:
+            self.local.server = self.make_server()
+            self.local.server_version = self.server_version
+        return self.local.server
+
+
+def measure_clock_offset(server):
+    """
+    Returns difference between server and local clocks.
+    Server time is assumed to be read in the middle of the round trip,
+    the sample with the shortest round trip is the most precise one.
+    """
+    best_round_trip, offset = None, 0
+    for _ in range(CLOCK_SAMPLES):
+        local_time = time()
+        start = perf_counter()
+        server_time = server.server_time()
+        round_trip = perf_counter() - start
+        if best_round_trip is None or round_trip < best_round_trip:
+            best_round_trip = round_trip
+            offset = server_time - (local_time + round_trip / 2)
+    return offset
 
 
 socket.setdefaulttimeout(3)
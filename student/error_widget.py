@@ -4,6 +4,7 @@ Widget to display data error.
 
 
 from PyQt5 import Qt
+import common
 
 
 class ErrorWidget(Qt.QWidget):
@@ -16,13 +17,13 @@ class ErrorWidget(Qt.QWidget):
         error_title = Qt.QLabel(
             'Произошла ошибка при чтении данных. Возможно, эти данные удалены или недействительны.',
             self)
-        error_title.setFont(Qt.QFont('Arial', 25))
+        error_title.setFont(common.font(25))
         error_title.setWordWrap(True)
 
         home_button = Qt.QPushButton('На главную', self)
         home_button.setObjectName('Flat')
         home_button.setCursor(Qt.Qt.PointingHandCursor)
-        home_button.setFont(Qt.QFont('Arial', 20))
+        home_button.setFont(common.font(20))
         home_button.clicked.connect(lambda _: app.display_home_page())
 
         button_layout = Qt.QHBoxLayout()
@@ -35,8 +36,8 @@ class ErrorWidget(Qt.QWidget):
         layout.addLayout(button_layout)
         self.setLayout(layout)
 
-    def update_status(self):
+    def display_data(self, parent):
         """
-        Kostyl.
+        Nothing to display, the widget is the same for all questions.
         """
         pass
@@ -11,6 +11,7 @@ class ExamPage(Qt.QWidget):
     """
     Exam page for student.
     """
+    @common.timed
     def __init__(self, app, exam_id):
         super().__init__()
         self.app = app
@@ -22,8 +23,13 @@ class ExamPage(Qt.QWidget):
         self.question_data = None
         self.questions_ids = []
         self.questions_results = []
+        self.questions_data = {}
+        self.buttons_ids = []
+        self.views = {}
+        self.shown_question_id = None
+        self.reloaded = False
 
-        back_button = Qt.QPushButton(Qt.QIcon(common.LEFT), '', self)
+        back_button = Qt.QPushButton(common.icon(common.LEFT), '', self)
         back_button.setObjectName('Flat')
         back_button.setCursor(Qt.Qt.PointingHandCursor)
         back_button.setIconSize(Qt.QSize(35, 35))
@@ -37,7 +43,9 @@ class ExamPage(Qt.QWidget):
 
         self.questions_layout = Qt.QHBoxLayout()
         self.questions_layout.setSpacing(0)
-        self.widget = Qt.QWidget(self)
+        self.widget = None
+        self.status_stack = Qt.QStackedWidget(self)
+        self.question_stack = Qt.QStackedWidget(self)
 
         scroll_layout = Qt.QHBoxLayout()
         scroll_layout.setSpacing(0)
@@ -59,45 +67,71 @@ class ExamPage(Qt.QWidget):
         layout = Qt.QVBoxLayout()
         layout.addLayout(upper_layout)
         layout.addSpacerItem(Qt.QSpacerItem(0, 10))
-        layout.addWidget(Qt.QWidget())
-        layout.addWidget(self.widget)
+        layout.addWidget(self.status_stack)
+        layout.addWidget(self.question_stack)
         self.setLayout(layout)
 
+    @common.timed
     def display_current_question(self):
         """
-        Displays current question.
+        Displays current question, views are reused and only filled with new data.
+        If the question is already displayed, views only update its results (reloaded is set).
         """
-        old_widget = self.layout().itemAt(3).widget()
-        old_widget.deleteLater()
-        self.layout().removeWidget(old_widget)
-        old_widget = self.layout().itemAt(2).widget()
-        old_widget.deleteLater()
-        self.layout().removeWidget(old_widget)
-        status_widget = self.app.get_exam_status_widget()
-        self.widget = self.app.get_question_widget()
-        self.layout().addWidget(status_widget)
-        self.layout().addWidget(self.widget)
+        same_question = self.shown_question_id == self.question_id
+        self.shown_question_id = self.question_id
+        status_class = self.app.get_exam_status_class()
+        self.status_stack.setVisible(status_class is not None)
+        if status_class is not None:
+            self.display_view(self.status_stack, status_class, same_question)
+        self.widget = self.display_view(
+            self.question_stack, self.app.get_question_class(), same_question)
+
+    def display_view(self, stack, view_class, same_question):
+        """
+        Displays data in the view of the class, the view is created once for the page.
+        """
+        view = self.views.get(view_class)
+        if view is None:
+            view = view_class(self.app)
+            self.views[view_class] = view
+            stack.addWidget(view)
+        self.reloaded = same_question and stack.currentWidget() is view
+        view.display_data(self)
+        stack.setCurrentWidget(view)
+        return view
 
     def refresh(self):
         """
-        Refreshes upper panel.
+        Refreshes upper panel, buttons are recreated only if the list of questions changed.
         """
+        if self.buttons_ids != self.questions_ids:
+            self.create_buttons()
         self.question_number = None
-        while self.questions_layout.count() > 0:
-            old_widget = self.questions_layout.itemAt(0).widget()
-            old_widget.deleteLater()
-            self.questions_layout.removeWidget(old_widget)
         for question in range(len(self.questions_ids)):
             question_id = self.questions_ids[question]
             question_result = self.questions_results[question]
             if question_id == self.question_id:
                 self.question_number = question + 1
                 self.question_result = question_result
+            question_button = self.questions_layout.itemAt(question).widget()
+            common.set_style_property(
+                question_button, 'result', common.question_result_state(question_result))
+            common.set_style_property(question_button, 'current', question_id == self.question_id)
+
+    def create_buttons(self):
+        """
+        Creates buttons for questions on the upper panel.
+        """
+        while self.questions_layout.count() > 0:
+            old_widget = self.questions_layout.itemAt(0).widget()
+            old_widget.deleteLater()
+            self.questions_layout.removeWidget(old_widget)
+        for question in range(len(self.questions_ids)):
             question_button = Qt.QPushButton(str(question + 1), self)
+            question_button.setObjectName('Question')
             question_button.setCursor(Qt.Qt.PointingHandCursor)
             question_button.setFixedSize(Qt.QSize(50, 50))
             question_button.clicked.connect(
-                common.return_lambda(self.app.view_exam_question, question_id))
-            question_button.setStyleSheet(
-                common.upper_question_style(question_result, question_id == self.question_id))
+                common.return_lambda(self.app.view_exam_question, self.questions_ids[question]))
             self.questions_layout.addWidget(question_button)
+        self.buttons_ids = list(self.questions_ids)
@@ -3,66 +3,77 @@ Contains all widgets for exam status.
 """
 
 
-from time import time
 from PyQt5 import Qt
-from timer import Timer
+import common
 
 
 class ExamRunning(Qt.QWidget):
     """
     Returns widget for running exam.
+    Widget is created once for the exam page, the timer keeps counting while questions change.
     """
-    def __init__(self, app, parent):
+    def __init__(self, app):
         super().__init__()
-        exam_data = parent.exam_data
+        self.app = app
+        self.exam_id = None
 
         finish_button = Qt.QPushButton('Закончить экзамен', self)
         finish_button.setObjectName('Button')
-        finish_button.setFont(Qt.QFont('Arial', 20))
-        finish_button.clicked.connect(lambda: app.finish_exam(exam_data['rowid']))
-
-        info_str = (
-            ' Всего баллов: ' + str(exam_data['total_score']) +
-            ' (из ' + str(exam_data['total_maxscore']) + ')'
-        )
+        finish_button.setFont(common.font(20))
+        finish_button.clicked.connect(lambda: app.finish_exam(self.exam_id))
 
-        info_label = Qt.QLabel(info_str, self)
-        info_label.setFont(Qt.QFont('Arial', 20))
+        self.info_label = Qt.QLabel(self)
+        self.info_label.setFont(common.font(20))
 
-        timer_label = Qt.QLabel(self)
-        timer_label.setFont(Qt.QFont('Arial', 25))
-
-        timer = Timer()
-        timer.tie(timer_label)
-        timer.start(exam_data['end'] - int(time()), lambda: app.finish_exam(exam_data['rowid']))
+        self.timer_label = Qt.QLabel(self)
+        self.timer_label.setFont(common.font(25))
 
         status_layout = Qt.QHBoxLayout()
         status_layout.addWidget(finish_button)
         status_layout.addSpacerItem(Qt.QSpacerItem(20, 0))
-        status_layout.addWidget(info_label)
+        status_layout.addWidget(self.info_label)
         status_layout.addSpacerItem(Qt.QSpacerItem(20, 0))
         status_layout.addStretch(1)
-        status_layout.addWidget(timer_label)
+        status_layout.addWidget(self.timer_label)
         self.setLayout(status_layout)
 
+    def display_data(self, parent):
+        """
+        Displays status of the exam of the exam page.
+        """
+        exam_data = parent.exam_data
+        self.exam_id = exam_data['rowid']
+        self.info_label.setText(
+            ' Всего баллов: ' + str(exam_data['total_score']) +
+            ' (из ' + str(exam_data['total_maxscore']) + ')'
+        )
+        self.app.timer.start(exam_data['end'], lambda: self.app.finish_exam(self.exam_id))
+        if self.app.timer.timer_label is not self.timer_label:
+            self.app.timer.tie(self.timer_label)
+
 
 class ExamFinished(Qt.QWidget):
     """
     Contains widget for finished exam.
     """
-    def __init__(self, parent):
+    def __init__(self, app):
         super().__init__()
+
+        self.info_label = Qt.QLabel(self)
+        self.info_label.setFont(common.font(25))
+        self.info_label.setWordWrap(True)
+
+        status_layout = Qt.QHBoxLayout()
+        status_layout.addWidget(self.info_label)
+        self.setLayout(status_layout)
+
+    def display_data(self, parent):
+        """
+        Displays status of the exam of the exam page.
+        """
         exam_data = parent.exam_data
-        info_str = (
+        self.info_label.setText(
             'Экзамен завершён. Суммарный балл: ' +
             str(exam_data['total_score']) + ' (из ' +
             str(exam_data['total_maxscore']) + ')'
         )
-
-        info_label = Qt.QLabel(info_str, self)
-        info_label.setFont(Qt.QFont('Arial', 25))
-        info_label.setWordWrap(True)
-
-        status_layout = Qt.QHBoxLayout()
-        status_layout.addWidget(info_label)
-        self.setLayout(status_layout)
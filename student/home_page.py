@@ -14,7 +14,7 @@ class HomePage(Qt.QWidget):
     def __init__(self, app, group_name, list_of_exams):
         super().__init__()
 
-        update_button = Qt.QPushButton(Qt.QIcon(common.UPDATE), '', self)
+        update_button = Qt.QPushButton(common.icon(common.UPDATE), '', self)
         update_button.setObjectName('Flat')
         update_button.setCursor(Qt.Qt.PointingHandCursor)
         update_button.setIconSize(Qt.QSize(35, 35))
@@ -22,15 +22,15 @@ class HomePage(Qt.QWidget):
         update_button.clicked.connect(lambda _: app.display_home_page())
 
         exams_title = Qt.QLabel('Экзамены группы ' + group_name, self)
-        exams_title.setFont(Qt.QFont('Arial', 30))
+        exams_title.setFont(common.font(30))
 
         view_profile_action = Qt.QWidgetAction(self)
-        view_profile_action.setFont(Qt.QFont('Arial', 15))
+        view_profile_action.setFont(common.font(15))
         view_profile_action.setText('Профиль')
         view_profile_action.triggered.connect(lambda _: app.display_profile_page())
 
         exit_action = Qt.QWidgetAction(self)
-        exit_action.setFont(Qt.QFont('Arial', 15))
+        exit_action.setFont(common.font(15))
         exit_action.setText('Выйти')
         exit_action.triggered.connect(lambda _: app.logout())
 
@@ -38,7 +38,7 @@ class HomePage(Qt.QWidget):
         user_menu.addAction(view_profile_action)
         user_menu.addAction(exit_action)
 
-        user_button = Qt.QPushButton(Qt.QIcon(common.USER), '', self)
+        user_button = Qt.QPushButton(common.icon(common.USER), '', self)
         user_button.setObjectName('Flat')
         user_button.setCursor(Qt.Qt.PointingHandCursor)
         user_button.setIconSize(Qt.QSize(35, 35))
@@ -55,11 +55,11 @@ class HomePage(Qt.QWidget):
             exam_id = exam['rowid']
             exam_name = exam['name']
 
-            exam_button = Qt.QPushButton(Qt.QIcon(common.EXAM30), exam_name, self)
+            exam_button = Qt.QPushButton(common.icon(common.EXAM30), exam_name, self)
             exam_button.setObjectName('Flat')
             exam_button.setCursor(Qt.Qt.PointingHandCursor)
             exam_button.setIconSize(Qt.QSize(30, 30))
-            exam_button.setFont(Qt.QFont('Arial', 20))
+            exam_button.setFont(common.font(20))
             exam_button.clicked.connect(common.return_lambda(app.display_exam, exam_id))
 
             exam_layout = Qt.QHBoxLayout()
@@ -0,0 +1,52 @@
+"""
+Contains JSON-RPC server proxy.
+"""
+
+
+import json
+import socket
+import itertools
+import urllib.request
+import urllib.error
+from xmlrpc.client import ServerProxy, Fault
+
+
+class JSONServerProxy:
+    """
+    Calls server functions through JSON-RPC.
+    Falls back to XML-RPC if the server does not support JSON-RPC.
+    """
+    def __init__(self, address, transport=None):
+        self.address = address
+        self.url = 'http://' + address + '/json'
+        self.transport = transport
+        self.fallback = None
+        self.ids = itertools.count(1)
+
+    def __getattr__(self, name):
+        return lambda *args: self.call(name, args)
+
+    def call(self, method, params):
+        """
+        Calls method with params on the server.
+        HTTP errors are answers of the server, so they are raised as Fault, not as connection errors.
+        """
+        if self.fallback is not None:
+            return getattr(self.fallback, method)(*params)
+        data = json.dumps(
+            {'id': next(self.ids), 'method': method, 'params': list(params)}
+        ).encode('utf-8')
+        request = urllib.request.Request(
+            self.url, data, {'Content-Type': 'application/json'})
+        timeout = getattr(self.transport, 'timeout', socket.getdefaulttimeout())
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                response = json.loads(response.read().decode('utf-8'))
+        except urllib.error.HTTPError as error:
+            if error.code != 404:
+                raise Fault(error.code, 'HTTP %d: %s' % (error.code, error.reason)) from None
+            self.fallback = ServerProxy('http://' + self.address, transport=self.transport)
+            return getattr(self.fallback, method)(*params)
+        if 'error' in response:
+            raise Fault(response['error'].get('code', 1), response['error']['message'])
+        return response['result']
@@ -0,0 +1,57 @@
+"""
+Contains outbox of submissions that are not delivered to the server yet.
+"""
+
+
+import os
+import json
+
+
+class Outbox:
+    """
+    Queue of submissions stored in the file, so it survives restarts of the client.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.entries = self.load()
+
+    def load(self):
+        """
+        Returns entries saved in the file.
+        """
+        try:
+            with open(self.path, encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return []
+
+    def save(self):
+        """
+        Saves entries to the file atomically.
+        """
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(self.entries, file, ensure_ascii=False, indent=4)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.path)
+
+    def push(self, entry):
+        """
+        Adds entry to the end of the queue.
+        """
+        self.entries.append(entry)
+        self.save()
+
+    def remove(self, entry):
+        """
+        Removes delivered entry.
+        """
+        self.entries.remove(entry)
+        self.save()
+
+    def user_entries(self, user_id):
+        """
+        Returns entries of the user in order of sending.
+        """
+        return [entry for entry in self.entries if entry['user_id'] == user_id]
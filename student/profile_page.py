@@ -14,7 +14,7 @@ class ProfilePage(Qt.QWidget):
     def __init__(self, app, group_name, user_name):
         super().__init__()
 
-        back_button = Qt.QPushButton(Qt.QIcon(common.LEFT), '', self)
+        back_button = Qt.QPushButton(common.icon(common.LEFT), '', self)
         back_button.setObjectName('Flat')
         back_button.setCursor(Qt.Qt.PointingHandCursor)
         back_button.setIconSize(Qt.QSize(35, 35))
@@ -22,7 +22,7 @@ class ProfilePage(Qt.QWidget):
         back_button.clicked.connect(lambda _: app.display_home_page())
 
         profile_title = Qt.QLabel('Профиль', self)
-        profile_title.setFont(Qt.QFont('Arial', 30))
+        profile_title.setFont(common.font(30))
         profile_title.setAlignment(Qt.Qt.AlignCenter)
 
         scroll_area = Qt.QScrollArea()
@@ -30,57 +30,57 @@ class ProfilePage(Qt.QWidget):
         scroll_area.setFrameShape(Qt.QFrame.NoFrame)
 
         info_title = Qt.QLabel('Информация', self)
-        info_title.setFont(Qt.QFont('Arial', 25))
+        info_title.setFont(common.font(25))
 
         user_title = Qt.QLabel('Имя пользователя:', self)
-        user_title.setFont(Qt.QFont('Arial', 20))
+        user_title.setFont(common.font(20))
 
         user_label = Qt.QLabel(user_name, self)
-        user_label.setFont(Qt.QFont('Arial', 20, 65, True))
+        user_label.setFont(common.font(20, 65, True))
 
         group_title = Qt.QLabel('Состоит в группе:', self)
-        group_title.setFont(Qt.QFont('Arial', 20))
+        group_title.setFont(common.font(20))
 
         group_label = Qt.QLabel(group_name, self)
-        group_label.setFont(Qt.QFont('Arial', 20, 65, True))
+        group_label.setFont(common.font(20, 65, True))
 
         change_password_title = Qt.QLabel('Изменить пароль', self)
-        change_password_title.setFont(Qt.QFont('Arial', 25))
+        change_password_title.setFont(common.font(25))
 
         old_password_title = Qt.QLabel('Старый пароль:', self)
-        old_password_title.setFont(Qt.QFont('Arial', 20))
+        old_password_title.setFont(common.font(20))
 
         self.old_password_input = Qt.QLineEdit(self)
-        self.old_password_input.setFont(Qt.QFont('Arial', 20))
+        self.old_password_input.setFont(common.font(20))
         self.old_password_input.setMinimumWidth(400)
         self.old_password_input.setEchoMode(Qt.QLineEdit.Password)
 
         new_password_title = Qt.QLabel('Новый пароль:', self)
-        new_password_title.setFont(Qt.QFont('Arial', 20))
+        new_password_title.setFont(common.font(20))
 
         self.new_password_input = Qt.QLineEdit(self)
-        self.new_password_input.setFont(Qt.QFont('Arial', 20))
+        self.new_password_input.setFont(common.font(20))
         self.new_password_input.setMinimumWidth(400)
         self.new_password_input.setEchoMode(Qt.QLineEdit.Password)
         self.new_password_input.textChanged.connect(self.update_change_password_button_state)
 
         repeat_title = Qt.QLabel('Повторите пароль:', self)
-        repeat_title.setFont(Qt.QFont('Arial', 20))
+        repeat_title.setFont(common.font(20))
 
         self.repeat_input = Qt.QLineEdit(self)
-        self.repeat_input.setFont(Qt.QFont('Arial', 20))
+        self.repeat_input.setFont(common.font(20))
         self.repeat_input.setMinimumWidth(400)
         self.repeat_input.setEchoMode(Qt.QLineEdit.Password)
         self.repeat_input.textChanged.connect(self.update_change_password_button_state)
 
         self.change_password_button = Qt.QPushButton('Изменить пароль', self)
         self.change_password_button.setObjectName('Button')
-        self.change_password_button.setFont(Qt.QFont('Arial', 20))
+        self.change_password_button.setFont(common.font(20))
         self.change_password_button.clicked.connect(lambda: app.change_password(
             self.old_password_input.text(), self.new_password_input.text()))
 
         self.status_label = Qt.QLabel(self)
-        self.status_label.setFont(Qt.QFont('Arial', 20))
+        self.status_label.setFont(common.font(20))
         self.status_label.setWordWrap(True)
         self.status_label.setMinimumWidth(380)
 
@@ -9,13 +9,14 @@ from PyQt5 import Qt
 class QuestionBase(Qt.QWidget):
     """
     Question basic class.
+    Widget is created once for the exam page and displays data of any question of its type.
     """
-    def __init__(self, parent):
-        super().__init__(parent)
+    def __init__(self):
+        super().__init__()
 
-        scroll_area = Qt.QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setFrameShape(Qt.QFrame.NoFrame)
+        self.scroll_area = Qt.QScrollArea()
+        self.scroll_area.setWidgetResizable(True)
+        self.scroll_area.setFrameShape(Qt.QFrame.NoFrame)
 
         self.layout = Qt.QVBoxLayout()
         self.layout.setContentsMargins(0, 0, 0, 0)
@@ -23,10 +24,27 @@ class QuestionBase(Qt.QWidget):
 
         scroll_widget = Qt.QWidget(self)
         scroll_widget.setLayout(self.layout)
-        scroll_area.setWidget(scroll_widget)
+        self.scroll_area.setWidget(scroll_widget)
 
         layout = Qt.QVBoxLayout()
-        layout.addWidget(scroll_area)
+        layout.addWidget(self.scroll_area)
         layout.addSpacerItem(Qt.QSpacerItem(0, 10))
         layout.addLayout(self.lower_layout)
         self.setLayout(layout)
+
+    def display_data(self, parent):
+        """
+        Displays data of the current question of the exam page.
+        Position and focus are kept if the question is only reloaded.
+        """
+        if not parent.reloaded:
+            self.scroll_area.verticalScrollBar().setValue(0)
+
+
+def next_question_id(parent):
+    """
+    Returns id of the question after the current one or None.
+    """
+    if parent.question_number < len(parent.questions_ids):
+        return parent.questions_ids[parent.question_number]
+    return None
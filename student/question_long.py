@@ -4,7 +4,7 @@ Contains all widgets for long question.
 
 
 from PyQt5 import Qt
-from question_base import QuestionBase
+from question_base import QuestionBase, next_question_id
 import common
 
 
@@ -12,46 +12,38 @@ class QuestionLong(QuestionBase):
     """
     Returns widget for long question.
     """
-    def __init__(self, app, parent):
-        super().__init__(parent)
-        question_data = parent.question_data
-        question_result = parent.question_result
-        next_question_id = None
-        if parent.question_number < len(parent.questions_ids):
-            next_question_id = parent.questions_ids[parent.question_number]
-        self.answer = question_result['answer'] if question_result else ''
+    def __init__(self, app):
+        super().__init__()
+        self.question_id = None
+        self.next_question_id = None
+        self.answer = ''
 
-        statement_label = Qt.QLabel(question_data['statement'], self)
-        statement_label.setFont(Qt.QFont('Arial', 20))
-        statement_label.setWordWrap(True)
+        self.statement_label = Qt.QLabel(self)
+        self.statement_label.setFont(common.font(20))
+        self.statement_label.setWordWrap(True)
 
         self.answer_input = Qt.QPlainTextEdit(self)
-        self.answer_input.setFont(Qt.QFont('Arial', 20))
-        self.answer_input.setPlainText(self.answer)
+        self.answer_input.setFont(common.font(20))
         self.answer_input.textChanged.connect(self.update_status)
 
         self.save_button = Qt.QPushButton('Сохранить', self)
         self.save_button.setObjectName('Button')
-        self.save_button.setFont(Qt.QFont('Arial', 20))
+        self.save_button.setFont(common.font(20))
         self.save_button.clicked.connect(
-            lambda: app.send_submission(question_data['rowid'], self.answer_input.toPlainText()))
+            lambda: app.send_submission(self.question_id, self.answer_input.toPlainText()))
 
         self.status_img = Qt.QLabel(self)
         self.status_img.setScaledContents(True)
         self.status_img.setFixedSize(Qt.QSize(50, 50))
 
         self.status_label = Qt.QLabel(self)
-        self.status_label.setFont(Qt.QFont('Arial', 20))
-        self.update_status()
-
-        next_button = Qt.QPushButton('Далее', self)
-        next_button.setObjectName('Button')
-        next_button.setFont(Qt.QFont('Arial', 20))
-        next_button.setAutoDefault(True)
-        next_button.clicked.connect(lambda: app.view_exam_question(next_question_id))
-        next_button.setFocus()
-        if next_question_id is None:
-            next_button.setDisabled(True)
+        self.status_label.setFont(common.font(20))
+
+        self.next_button = Qt.QPushButton('Далее', self)
+        self.next_button.setObjectName('Button')
+        self.next_button.setFont(common.font(20))
+        self.next_button.setAutoDefault(True)
+        self.next_button.clicked.connect(lambda: app.view_exam_question(self.next_question_id))
 
         self.lower_layout.addWidget(self.save_button)
         self.lower_layout.addSpacerItem(Qt.QSpacerItem(20, 0))
@@ -59,12 +51,33 @@ class QuestionLong(QuestionBase):
         self.lower_layout.addWidget(self.status_label)
         self.lower_layout.addSpacerItem(Qt.QSpacerItem(10, 0))
         self.lower_layout.addStretch(1)
-        self.lower_layout.addWidget(next_button)
+        self.lower_layout.addWidget(self.next_button)
 
-        self.layout.addWidget(statement_label)
+        self.layout.addWidget(self.statement_label)
         self.layout.addSpacerItem(Qt.QSpacerItem(0, 20))
         self.layout.addWidget(self.answer_input)
 
+    def display_data(self, parent):
+        """
+        Displays data of the current question of the exam page.
+        Text typed after the last saving is kept if the question is only reloaded.
+        """
+        super().display_data(parent)
+        question_result = parent.question_result
+        edited = parent.reloaded and self.answer_input.toPlainText() != self.answer
+        self.question_id = parent.question_data['rowid']
+        self.next_question_id = next_question_id(parent)
+        self.answer = question_result['answer'] if question_result else ''
+
+        self.statement_label.setText(parent.question_data['statement'])
+        if edited:
+            self.update_status()
+        else:
+            self.answer_input.setPlainText(self.answer)
+        self.next_button.setDisabled(self.next_question_id is None)
+        if not parent.reloaded:
+            self.next_button.setFocus()
+
     def update_status(self):
         """
         Call after modifying.
@@ -72,11 +85,11 @@ class QuestionLong(QuestionBase):
         answer = self.answer
         saved_answer = self.answer_input.toPlainText()
         if saved_answer != answer:
-            self.status_img.setPixmap(Qt.QPixmap(common.WARNING))
+            self.status_img.setPixmap(common.pixmap(common.WARNING))
             self.status_label.setText('Сохраните')
             self.status_label.setStyleSheet('color: ' + common.YELLOW)
         else:
-            self.status_img.setPixmap(Qt.QPixmap(common.TICK))
+            self.status_img.setPixmap(common.pixmap(common.TICK))
             self.status_label.setText('Сохранено')
             self.status_label.setStyleSheet('color: ' + common.GREEN)
 
@@ -85,28 +98,22 @@ class QuestionLongDetails(QuestionBase):
     """
     Returns widget for details of long question.
     """
-    def __init__(self, parent):
-        super().__init__(parent)
-        question_data = parent.question_data
-        question_result = parent.question_result
-        question_details = common.get_question_details(question_result)
-        question_style = common.main_question_style(question_result)
+    def __init__(self, app):
+        super().__init__()
 
-        statement_label = Qt.QLabel(question_data['statement'], self)
-        statement_label.setFont(Qt.QFont('Arial', 20))
-        statement_label.setWordWrap(True)
+        self.statement_label = Qt.QLabel(self)
+        self.statement_label.setFont(common.font(20))
+        self.statement_label.setWordWrap(True)
 
-        answer_input = Qt.QPlainTextEdit(question_details['answer'], self)
-        answer_input.setFont(Qt.QFont('Arial', 20))
-        answer_input.setReadOnly(True)
+        self.answer_input = Qt.QPlainTextEdit(self)
+        self.answer_input.setFont(common.font(20))
+        self.answer_input.setReadOnly(True)
 
         score_title = Qt.QLabel('Получено баллов:', self)
-        score_title.setFont(Qt.QFont('Arial', 25))
+        score_title.setFont(common.font(25))
 
-        score_label = Qt.QLabel(question_details['score'] + ' (' +
-                                str(question_data['maxscore']) + ')', self)
-        score_label.setFont(Qt.QFont('Arial', 20))
-        score_label.setStyleSheet('color: ' + question_style['main_color'])
+        self.score_label = Qt.QLabel(self)
+        self.score_label.setFont(common.font(20))
 
         title_layout = Qt.QVBoxLayout()
         title_layout.addSpacerItem(Qt.QSpacerItem(0, 20))
@@ -114,7 +121,7 @@ class QuestionLongDetails(QuestionBase):
 
         value_layout = Qt.QVBoxLayout()
         value_layout.addSpacerItem(Qt.QSpacerItem(0, 20))
-        value_layout.addWidget(score_label)
+        value_layout.addWidget(self.score_label)
 
         main_layout = Qt.QHBoxLayout()
         main_layout.addLayout(title_layout)
@@ -122,7 +129,22 @@ class QuestionLongDetails(QuestionBase):
         main_layout.addLayout(value_layout)
         main_layout.addStretch(1)
 
-        self.layout.addWidget(statement_label)
+        self.layout.addWidget(self.statement_label)
         self.layout.addSpacerItem(Qt.QSpacerItem(0, 20))
-        self.layout.addWidget(answer_input)
+        self.layout.addWidget(self.answer_input)
         self.layout.addLayout(main_layout)
+
+    def display_data(self, parent):
+        """
+        Displays data of the current question of the exam page.
+        """
+        super().display_data(parent)
+        question_data = parent.question_data
+        question_details = common.get_question_details(parent.question_result)
+        question_style = common.main_question_style(parent.question_result)
+
+        self.statement_label.setText(question_data['statement'])
+        self.answer_input.setPlainText(question_details['answer'])
+        self.score_label.setText(
+            question_details['score'] + ' (' + str(question_data['maxscore']) + ')')
+        self.score_label.setStyleSheet(question_style['color_style'])
@@ -15,44 +15,44 @@ class RegisterPage(Qt.QWidget):
         super().__init__()
 
         register_title = Qt.QLabel('Регистрация пользователя', self)
-        register_title.setFont(Qt.QFont('Arial', 30))
+        register_title.setFont(common.font(30))
         register_title.setAlignment(Qt.Qt.AlignCenter)
 
         group_title = Qt.QLabel('Название группы:', self)
-        group_title.setFont(Qt.QFont('Arial', 20))
+        group_title.setFont(common.font(20))
 
         group_input = Qt.QLineEdit(self)
-        group_input.setFont(Qt.QFont('Arial', 20))
+        group_input.setFont(common.font(20))
         group_input.setMinimumWidth(400)
 
         user_title = Qt.QLabel('Ваш логин:', self)
-        user_title.setFont(Qt.QFont('Arial', 20))
+        user_title.setFont(common.font(20))
 
         user_input = Qt.QLineEdit(self)
-        user_input.setFont(Qt.QFont('Arial', 20))
+        user_input.setFont(common.font(20))
         user_input.setMinimumWidth(400)
 
         password_title = Qt.QLabel('Придумайте пароль:', self)
-        password_title.setFont(Qt.QFont('Arial', 20))
+        password_title.setFont(common.font(20))
 
         self.password_input = Qt.QLineEdit(self)
-        self.password_input.setFont(Qt.QFont('Arial', 20))
+        self.password_input.setFont(common.font(20))
         self.password_input.setMinimumWidth(400)
         self.password_input.setEchoMode(Qt.QLineEdit.Password)
         self.password_input.textChanged.connect(self.update_button_state)
 
         repeat_title = Qt.QLabel('Повторите пароль:', self)
-        repeat_title.setFont(Qt.QFont('Arial', 20))
+        repeat_title.setFont(common.font(20))
 
         self.repeat_input = Qt.QLineEdit(self)
-        self.repeat_input.setFont(Qt.QFont('Arial', 20))
+        self.repeat_input.setFont(common.font(20))
         self.repeat_input.setMinimumWidth(400)
         self.repeat_input.setEchoMode(Qt.QLineEdit.Password)
         self.repeat_input.textChanged.connect(self.update_button_state)
 
         self.register_button = Qt.QPushButton('Зарегистрироваться', self)
         self.register_button.setObjectName('Button')
-        self.register_button.setFont(Qt.QFont('Arial', 20))
+        self.register_button.setFont(common.font(20))
         self.register_button.clicked.connect(lambda: app.register(
             group_input.text(), user_input.text(), self.password_input.text()))
         self.repeat_input.returnPressed.connect(self.register_button.click)
@@ -61,14 +61,14 @@ class RegisterPage(Qt.QWidget):
         group_input.returnPressed.connect(self.register_button.click)
 
         self.status_label = Qt.QLabel(self)
-        self.status_label.setFont(Qt.QFont('Arial', 20))
+        self.status_label.setFont(common.font(20))
         self.status_label.setWordWrap(True)
         self.status_label.setMinimumWidth(380)
 
         enter_button = Qt.QPushButton('Вход', self)
         enter_button.setObjectName('Flat')
         enter_button.setCursor(Qt.Qt.PointingHandCursor)
-        enter_button.setFont(Qt.QFont('Arial', 20))
+        enter_button.setFont(common.font(20))
         enter_button.clicked.connect(app.display_login_page)
         enter_button.setStyleSheet('color: ' + common.GREY)
 
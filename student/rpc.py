@@ -0,0 +1,127 @@
+"""
+Contains asynchronous calls of server functions.
+"""
+
+
+from PyQt5 import Qt
+
+
+MAX_THREADS = 4
+
+
+class CallSignals(Qt.QObject):
+    """
+    Signals of the server call.
+    """
+    finished = Qt.pyqtSignal(object)
+    failed = Qt.pyqtSignal(object)
+
+
+class ServerSignals(Qt.QObject):
+    """
+    Signals of the server state, can be emitted from any thread.
+    """
+    reconnecting = Qt.pyqtSignal()
+
+
+class Call(Qt.QRunnable):
+    """
+    Calls function with the server proxy of the thread in the thread pool.
+    """
+    def __init__(self, get_server, function):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.get_server = get_server
+        self.function = function
+        self.signals = CallSignals()
+
+    def run(self):
+        """
+        Calls the function and emits it's result or error.
+        """
+        try:
+            result = self.function(self.get_server())
+        except Exception as error:
+            self.signals.failed.emit(error)
+        else:
+            self.signals.finished.emit(result)
+
+
+class Request:
+    """
+    Independent server calls that run concurrently.
+    """
+    def __init__(self, size, on_finished, on_failed):
+        self.results = [None] * size
+        self.left = size
+        self.failed = False
+        self.on_finished = on_finished
+        self.on_failed = on_failed
+
+    def set_result(self, index, result):
+        """
+        Saves result of the call with this index.
+        """
+        if self.failed:
+            return
+        self.results[index] = result
+        self.left -= 1
+        if self.left == 0:
+            self.on_finished(self.results)
+
+    def set_error(self, error):
+        """
+        Reports the first error of the calls.
+        """
+        if not self.failed:
+            self.failed = True
+            self.on_failed(error)
+
+
+class AsyncServer:
+    """
+    Runs server calls in the thread pool.
+    Results are delivered to the main thread through signals.
+    """
+    def __init__(self, get_server):
+        self.get_server = get_server
+        self.pool = Qt.QThreadPool()
+        self.pool.setMaxThreadCount(MAX_THREADS)
+        self.calls = set()
+        self.signals = ServerSignals()
+
+    def request(self, calls, on_finished, on_failed):
+        """
+        Runs calls (pairs of method and args) concurrently.
+        Calls on_finished with list of results or on_failed with the first error.
+        """
+        request = Request(len(calls), on_finished, on_failed)
+        if not calls:
+            on_finished([])
+        for index, (method, args) in enumerate(calls):
+            call = Call(
+                self.get_server,
+                lambda server, method=method, args=args: getattr(server, method)(*args))
+            call.signals.finished.connect(
+                lambda result, call=call, index=index: self.finish(call, request.set_result, index, result))
+            call.signals.failed.connect(
+                lambda error, call=call: self.finish(call, request.set_error, error))
+            self.calls.add(call)
+            self.pool.start(call)
+
+    def finish(self, call, function, *args):
+        """
+        Releases the finished call and passes it's result to function.
+        """
+        self.calls.discard(call)
+        function(*args)
+
+    def run(self, function, on_finished, on_failed):
+        """
+        Runs function with the server proxy as the only argument in the thread pool.
+        """
+        call = Call(self.get_server, function)
+        call.signals.finished.connect(lambda result: self.finish(call, on_finished, result))
+        call.signals.failed.connect(lambda error: self.finish(call, on_failed, error))
+        self.calls.add(call)
+        self.pool.start(call)
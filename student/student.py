@@ -3,37 +3,22 @@ Examiner project, student module.
 """
 
 
+from time import perf_counter
+STARTED = perf_counter()
+
 import sys
+import uuid
 import socket
-import functools
 
 from PyQt5 import Qt
-from client import Client
-from settings_page import SettingsPage
+from client import Client, measure_clock_offset
+from rpc import AsyncServer
+from transport import is_invalid_session
+from timer import Timer
+from outbox import Outbox
 from login_page import LoginPage
-from register_page import RegisterPage
-from home_page import HomePage
-from profile_page import ProfilePage
-from start_exam_page import StartExamPage
-from error_widget import ErrorWidget
-from exam_page import ExamPage
-from exam_status import ExamRunning, ExamFinished
-from question_short import QuestionShort, QuestionShortChecked, QuestionShortDetails
-from question_long import QuestionLong, QuestionLongDetails
-
-
-def safe(function):
-    """
-    Returns safe function.
-    """
-    @functools.wraps(function)
-    def result(self, *args, **kwargs):
-        try:
-            return function(self, *args, **kwargs)
-        except socket.error:
-            self.display_settings_page()
-            self.widget.set_failed_state()
-    return result
+import common
+IMPORTED = perf_counter()
 
 
 class Application(Qt.QApplication):
@@ -43,25 +28,70 @@ class Application(Qt.QApplication):
     def __init__(self):
         super().__init__(sys.argv)
         self.client = Client()
+        self.rpc = AsyncServer(self.client.thread_server)
+        self.timer = Timer(self.client.server_time)
+        self.navigation = 0
+        self.loading = 0
         self.window = Qt.QWidget()
-        self.window.setStyleSheet(open('client//style.css').read())
         self.window.setWindowTitle('Student')
         self.window.setGeometry(200, 100, 1000, 700)
         self.widget = Qt.QWidget(self.window)
-        self.layout = Qt.QHBoxLayout(self.window)
+        self.loading_label = Qt.QLabel('Загрузка...', self.window)
+        self.loading_label.setFont(common.font(15))
+        self.loading_label.hide()
+        self.rpc.signals.reconnecting.connect(
+            lambda: self.loading_label.setText('Переподключение...'))
+        self.client.on_retry = self.rpc.signals.reconnecting.emit
+        self.settings_watcher = Qt.QFileSystemWatcher([self.client.path])
+        self.settings_watcher.fileChanged.connect(self.settings_changed)
+        self.outbox = Outbox(common.OUTBOX)
+        self.sending = False
+        self.outbox_timer = Qt.QTimer()
+        self.outbox_timer.setSingleShot(True)
+        self.outbox_timer.setInterval(common.OUTBOX_RETRY)
+        self.outbox_timer.timeout.connect(self.send_outbox)
+        self.outbox_label = Qt.QLabel(self.window)
+        self.outbox_label.setFont(common.font(15))
+        self.outbox_label.setStyleSheet('color: ' + common.RED)
+        self.outbox_label.hide()
+        self.layout = Qt.QVBoxLayout(self.window)
         self.layout.addWidget(self.widget)
+        self.layout.addWidget(self.outbox_label)
+        self.layout.addWidget(self.loading_label)
+        if common.TIMING:
+            self.window.installEventFilter(self)
         self.window.show()
+        Qt.QTimer.singleShot(0, self.load_style)
 
     def display_widget(self, widget):
         """
         Displays the widget.
         """
+        self.navigation += 1
+        self.timer.reset()
         old = self.widget
         old.deleteLater()
         self.layout.removeWidget(old)
-        self.layout.addWidget(widget)
+        self.layout.insertWidget(0, widget)
         self.widget = widget
 
+    def load_style(self):
+        """
+        Loads style sheet of the window after the first paint.
+        """
+        with open('client//style.css', encoding='utf-8') as file:
+            self.window.setStyleSheet(file.read())
+
+    def eventFilter(self, watched, event):
+        """
+        Reports time of the first paint of the window in timing mode.
+        """
+        if watched is self.window and event.type() == Qt.QEvent.Paint:
+            self.window.removeEventFilter(self)
+            print('imports: %.1f ms' % ((IMPORTED - STARTED) * 1000))
+            print('first paint: %.1f ms' % ((perf_counter() - STARTED) * 1000))
+        return False
+
     def start(self):
         """
         Starts application.
@@ -69,30 +99,141 @@ class Application(Qt.QApplication):
         self.display_login_page()
         self.exit(self.exec_())
 
+    def set_loading(self, delta):
+        """
+        Shows loading state while there are unfinished requests.
+        """
+        self.loading += delta
+        if self.loading == 0 or self.loading == delta:
+            self.loading_label.setText('Загрузка...')
+        self.loading_label.setVisible(self.loading > 0)
+        self.window.setCursor(Qt.Qt.BusyCursor if self.loading > 0 else Qt.Qt.ArrowCursor)
+
+    def request(self, calls, on_finished, on_failed=None, navigate=True, relogin=True):
+        """
+        Runs server calls (pairs of method and args) in background, cached results are reused.
+        Results are passed to on_finished only if no other page was requested meanwhile,
+        results of background requests (not navigate) - if the page is still displayed.
+        If the server lost the session, the user is logged in again and the calls are repeated.
+        """
+        if navigate:
+            self.navigation += 1
+        navigation = self.navigation
+        page = self.widget
+
+        def is_actual():
+            if navigate:
+                return navigation == self.navigation
+            return self.widget is page
+        cache_version = self.client.cache_version
+        results = [None] * len(calls)
+        missing = []
+        for index, (method, args) in enumerate(calls):
+            found, results[index] = self.client.get_cached(method, args)
+            if not found:
+                missing.append(index)
+        if not missing:
+            on_finished(*results)
+            return
+
+        def finished(fetched):
+            self.set_loading(-1)
+            for index, result in zip(missing, fetched):
+                results[index] = result
+                if cache_version == self.client.cache_version:
+                    self.client.set_cached(*calls[index], result)
+            if is_actual():
+                on_finished(*results)
+
+        def failed(error):
+            self.set_loading(-1)
+            if not is_actual():
+                return
+            if relogin and is_invalid_session(error) and self.client.user:
+                token = self.client.user['token']
+                self.relogin(token, lambda new_token: self.request(
+                    [(method, tuple(new_token if arg == token else arg for arg in args))
+                     for method, args in calls],
+                    on_finished, on_failed, navigate, relogin=False), on_failed)
+                return
+            (on_failed or self.connection_failed)(error)
+
+        self.set_loading(1)
+        self.rpc.request([calls[index] for index in missing], finished, failed)
+
+    def relogin(self, token, on_finished, on_failed=None):
+        """
+        Logs in again with saved user name and password after the server lost the session with token.
+        New token is passed to on_finished, the login page is displayed if login fails.
+        """
+        def finished(results):
+            self.set_loading(-1)
+            if not results[0][0]:
+                self.client.user = False
+                self.display_login_page()
+                return
+            self.client.user = results[0][1]
+            on_finished(self.client.user['token'])
+
+        def failed(error):
+            self.set_loading(-1)
+            (on_failed or self.connection_failed)(error)
+
+        if self.client.user and self.client.user['token'] != token:
+            on_finished(self.client.user['token'])
+            return
+        password_hash = self.client.encode_password(self.client.password)
+        self.set_loading(1)
+        self.rpc.request(
+            [('login', (self.client.user_name, password_hash, 0))], finished, failed)
+
+    def connection_failed(self, error):
+        """
+        Displays settings page if the server is unavailable,
+        login page if the server does not know the session.
+        """
+        if is_invalid_session(error):
+            self.client.user = False
+            self.display_login_page()
+            return
+        if not isinstance(error, socket.error):
+            raise error
+        self.display_settings_page()
+        self.widget.set_failed_state()
+
     def check_ip(self, ip_address):
         """
         Checks ip-address of server.
         """
-        try:
-            self.widget.set_waiting_state()
-            self.client.update_data({'server': ip_address})
-            self.client.update_server()
-            self.client.server.ping()
-            self.widget.set_succeeded_state()
-        except socket.error:
-            self.widget.set_failed_state()
+        self.widget.set_waiting_state()
+        self.client.update_data({'server': ip_address})
+        self.client.update_server()
+        self.request(
+            [('ping', ())],
+            lambda _: self.widget.set_succeeded_state(),
+            lambda _: self.widget.set_failed_state(),
+            navigate=False)
+
+    def settings_changed(self, path):
+        """
+        Applies settings edited by another program.
+        """
+        if path not in self.settings_watcher.files():
+            self.settings_watcher.addPath(path)
+        self.client.reload_data()
 
     def save_settings(self, settings):
         """
         Saves all settings.
         """
-        self.client.set_data(settings)
+        self.client.update_data(settings)
         self.display_login_page()
 
     def display_settings_page(self):
         """
         Displays settings page.
         """
+        from settings_page import SettingsPage
         self.display_widget(SettingsPage(self))
 
     def display_login_page(self):
@@ -105,183 +246,322 @@ class Application(Qt.QApplication):
         """
         Displays register page for student.
         """
+        from register_page import RegisterPage
         self.display_widget(RegisterPage(self))
 
-    @safe
     def register(self, group_name, user_name, password):
         """
         Tries to register the student.
         """
+        def finished(result):
+            if not result[0]:
+                self.widget.set_failed_state(result[1])
+            else:
+                self.client.user_name = user_name
+                self.client.password = password
+                self.display_login_page()
+
         self.widget.set_waiting_state()
         password_hash = self.client.encode_password(password)
-        result = self.client.server.register(user_name, password_hash, 0, group_name)
-        if not result[0]:
-            self.widget.set_failed_state(result[1])
-        else:
-            self.client.user_name = user_name
-            self.client.password = password
-            self.display_login_page()
+        self.request([('register', (user_name, password_hash, 0, group_name))], finished)
 
-    @safe
     def login(self, user_name, password):
         """
         Tries to login the student.
         """
+        def finished(result):
+            if not result[0]:
+                self.client.user = False
+                self.widget.set_failed_state(result[1])
+            else:
+                self.client.user = result[1]
+                self.client.invalidate()
+                self.sync_clock()
+                self.send_outbox()
+                self.display_home_page()
+
         self.widget.set_waiting_state()
         self.client.user_name = user_name
         self.client.password = password
         password_hash = self.client.encode_password(password)
-        result = self.client.server.login(user_name, password_hash, 0)
-        if not result[0]:
-            self.client.user = False
-            self.widget.set_failed_state(result[1])
-        else:
-            self.client.user = result[1]
-            self.display_home_page()
+        self.request([('login', (user_name, password_hash, 0))], finished)
+
+    def sync_clock(self):
+        """
+        Estimates offset of the server clock in background and corrects the timer.
+        """
+        def finished(offset):
+            self.client.clock_offset = offset
+            self.timer.resync()
+
+        self.rpc.run(measure_clock_offset, finished, lambda _: None)
 
-    @safe
     def logout(self):
         """
         Logs out the student.
         """
+        if self.client.user:
+            self.rpc.request(
+                [('logout', (self.client.user['token'],))], lambda _: None, lambda _: None)
         self.client.user = False
+        self.client.invalidate()
         self.display_login_page()
 
-    @safe
     def change_password(self, old_password, new_password):
         """
         Changes password of current user.
         """
+        def finished(result):
+            if not result[0]:
+                self.widget.set_failed_state(result[1])
+            else:
+                self.client.password = new_password
+                self.logout()
+
         self.widget.set_waiting_state()
         old_password_hash = self.client.encode_password(old_password)
         new_password_hash = self.client.encode_password(new_password)
-        result = self.client.server.change_password(
-            self.client.user['rowid'], old_password_hash, new_password_hash)
-        if not result[0]:
-            self.widget.set_failed_state(result[1])
-        else:
-            self.client.password = new_password
-            self.logout()
+        self.request([(
+            'change_password',
+            (self.client.user['token'], old_password_hash, new_password_hash)
+        )], finished)
 
-    def current_group_name(self):
-        """
-        Returns group name of current user.
-        """
-        return self.client.server.get_group_data(self.client.user['group_id'])['name']
-
-    def list_of_exams(self):
-        """
-        Returns list of exams.
-        """
-        return self.client.server.list_of_published_exams(self.client.user['group_id'])
-
-    @safe
     def display_home_page(self):
         """
         Displays home page with list of exams.
         """
-        group_name = self.current_group_name()
-        list_of_exams = self.list_of_exams()
-        self.display_widget(HomePage(self, group_name, list_of_exams))
+        from home_page import HomePage
+        group_id = self.client.user['group_id']
+        self.request([
+            ('get_group_data', (group_id,)),
+            ('list_of_published_exams', (group_id,))
+        ], lambda group_data, list_of_exams: self.display_widget(
+            HomePage(self, group_data['name'], list_of_exams)))
 
-    @safe
     def display_profile_page(self):
         """
         Displays user profile.
         """
-        group_name = self.current_group_name()
+        from profile_page import ProfilePage
         user_name = self.client.user['name']
-        self.display_widget(ProfilePage(self, group_name, user_name))
+        self.request(
+            [('get_group_data', (self.client.user['group_id'],))],
+            lambda group_data: self.display_widget(
+                ProfilePage(self, group_data['name'], user_name)))
 
     def display_start_exam_page(self, exam_data, cnt_questions):
         """
         Displays page before starting the exam.
         """
+        from start_exam_page import StartExamPage
         self.display_widget(StartExamPage(self, exam_data, cnt_questions))
 
-    @safe
     def start_exam(self, exam_id):
         """
         Starts the exam.
         """
-        self.client.server.start_exam(exam_id, self.client.user['rowid'])
-        self.display_exam(exam_id)
+        self.request(
+            [('start_exam', (exam_id, self.client.user['token']))],
+            lambda _: self.display_exam(exam_id))
 
-    @safe
     def finish_exam(self, exam_id):
         """
         Finishes the exam.
         """
-        self.client.server.finish_exam(exam_id, self.client.user['rowid'])
-        self.display_exam(exam_id)
+        self.request(
+            [('finish_exam', (exam_id, self.client.user['token']))],
+            lambda _: self.display_exam(exam_id))
 
-    @safe
     def display_exam(self, exam_id):
         """
         Displays the exam depending on it's current state.
         """
-        exam_data = self.client.server.get_exam_data_student(exam_id, self.client.user['rowid'])
-        questions_ids = self.client.server.get_questions_ids(exam_id)
-        if not exam_data:
-            self.display_widget(ErrorWidget(self))
-            return
-        if exam_data['state'] == 'Not started':
-            self.display_start_exam_page(exam_data, len(questions_ids))
-        else:
-            self.display_widget(ExamPage(self, exam_id))
-            self.view_exam_question(questions_ids[0] if questions_ids else -1)
+        from error_widget import ErrorWidget
+        from exam_page import ExamPage
 
-    @safe
-    def view_exam_question(self, question_id):
+        def finished(exam_data, questions_ids):
+            if not exam_data:
+                self.display_widget(ErrorWidget(self))
+            elif exam_data['state'] == 'Not started':
+                self.display_start_exam_page(exam_data, len(questions_ids))
+            else:
+                self.display_widget(ExamPage(self, exam_id))
+                self.view_exam_question(questions_ids[0] if questions_ids else -1)
+                self.prefetch_questions(exam_id)
+
+        self.request([
+            ('get_exam_data_student', (exam_id, self.client.user['token'])),
+            ('get_questions_ids', (exam_id,))
+        ], finished)
+
+    def prefetch_questions(self, exam_id):
         """
-        Displays selected question.
+        Loads data of all questions of the exam page in background with one server call.
+        """
+        def finished(questions_data):
+            for question_data in questions_data:
+                page.questions_data.setdefault(question_data['rowid'], question_data)
+
+        page = self.widget
+        self.request(
+            [('get_questions_data', (exam_id,))], finished, lambda _: None, navigate=False)
+
+    def display_exam_question(self, question_id):
+        """
+        Displays the question from data loaded on the exam page.
         """
-        exam_id = self.widget.exam_id
-        user_id = self.client.user['rowid']
         self.widget.question_id = question_id
-        self.widget.exam_data = self.client.server.get_exam_data_student(exam_id, user_id)
-        self.widget.question_data = self.client.server.get_question_data(question_id)
-        self.widget.questions_ids = self.client.server.get_questions_ids(exam_id)
-        self.widget.questions_results = self.client.server.get_questions_results(exam_id, user_id)
+        self.widget.question_data = self.widget.questions_data[question_id]
         self.widget.refresh()
         self.widget.display_current_question()
 
-    def get_exam_status_widget(self):
+    def view_exam_question(self, question_id):
+        """
+        Displays selected question, prefetched questions are displayed without server calls.
+        """
+        from error_widget import ErrorWidget
+
+        def finished(exam_data, question_data, questions_ids, questions_results):
+            if questions_results is False:
+                self.display_widget(ErrorWidget(self))
+                return
+            self.widget.exam_data = exam_data
+            self.widget.questions_ids = questions_ids
+            self.widget.questions_results = questions_results
+            self.widget.questions_data[question_id] = question_data
+            self.display_exam_question(question_id)
+
+        if question_id in self.widget.questions_data:
+            self.navigation += 1
+            self.display_exam_question(question_id)
+            return
+        exam_id = self.widget.exam_id
+        token = self.client.user['token']
+        self.request([
+            ('get_exam_data_student', (exam_id, token)),
+            ('get_question_data', (question_id,)),
+            ('get_questions_ids', (exam_id,)),
+            ('get_questions_results', (exam_id, token))
+        ], finished)
+
+    def update_exam_results(self, question_id):
+        """
+        Reloads results of the exam page in background, the question is displayed again if it is open.
+        """
+        def finished(exam_data, questions_results):
+            if questions_results is False:
+                return
+            self.widget.exam_data = exam_data
+            self.widget.questions_results = questions_results
+            if self.widget.question_id == question_id:
+                self.display_exam_question(question_id)
+            else:
+                self.widget.refresh()
+
+        exam_id = self.widget.exam_id
+        token = self.client.user['token']
+        self.request([
+            ('get_exam_data_student', (exam_id, token)),
+            ('get_questions_results', (exam_id, token))
+        ], finished, lambda _: None, navigate=False)
+
+    def get_exam_status_class(self):
         """
-        Returns exam status widget.
+        Returns class of the exam status view or None.
         """
+        from exam_status import ExamRunning, ExamFinished
         if not self.widget.exam_data:
-            return Qt.QWidget()
+            return None
         if self.widget.exam_data['state'] == 'Running':
-            return ExamRunning(self, self.widget)
-        return ExamFinished(self.widget)
+            return ExamRunning
+        return ExamFinished
 
-    def get_question_widget(self):
+    def get_question_class(self):
         """
-        Returns the question widget depending on it's type.
+        Returns class of the question view depending on it's type.
         """
+        from error_widget import ErrorWidget
+        from question_short import QuestionShort, QuestionShortChecked, QuestionShortDetails
+        from question_long import QuestionLong, QuestionLongDetails
         if not self.widget.question_data:
-            return ErrorWidget(self)
+            return ErrorWidget
         if self.widget.question_data['type'] == 'Short':
             if self.widget.exam_data['state'] == 'Finished':
-                return QuestionShortDetails(self.widget)
+                return QuestionShortDetails
             if self.widget.question_result:
-                return QuestionShortChecked(self, self.widget)
-            return QuestionShort(self, self.widget)
+                return QuestionShortChecked
+            return QuestionShort
         if self.widget.question_data['type'] == 'Long':
             if self.widget.exam_data['state'] == 'Finished':
-                return QuestionLongDetails(self.widget)
-            return QuestionLong(self, self.widget)
-        return ErrorWidget(self)
+                return QuestionLongDetails
+            return QuestionLong
+        return ErrorWidget
 
-    @safe
     def send_submission(self, question_id, answer):
         """
-        Sends the answer.
+        Puts the answer to the outbox and sends it.
         """
-        exam_id = self.widget.exam_id
-        self.client.server.add_submission(exam_id, question_id, answer, self.client.user['rowid'])
-        self.view_exam_question(question_id)
+        self.outbox.push({
+            'user_id': self.client.user['rowid'],
+            'exam_id': self.widget.exam_id,
+            'question_id': question_id,
+            'answer': answer,
+            'request_key': uuid.uuid4().hex
+        })
+        self.send_outbox()
+
+    def send_outbox(self):
+        """
+        Sends submissions from the outbox of the current user in order.
+        Sending is retried later if the server is unavailable, after login if the session is lost.
+        Submission is dropped only if the server rejected it.
+        """
+        from exam_page import ExamPage
+
+        if self.sending or not self.client.user:
+            return
+        entries = self.outbox.user_entries(self.client.user['rowid'])
+        if not entries:
+            self.update_outbox_label(0)
+            return
+        entry = entries[0]
+        token = self.client.user['token']
+
+        def finished(_):
+            self.sending = False
+            self.outbox.remove(entry)
+            if isinstance(self.widget, ExamPage) and self.widget.exam_id == entry['exam_id']:
+                self.update_exam_results(entry['question_id'])
+            self.send_outbox()
+
+        def failed(error):
+            self.sending = False
+            if is_invalid_session(error):
+                self.relogin(token, lambda _: self.send_outbox(), retry_later)
+            elif not isinstance(error, socket.error):
+                self.outbox.remove(entry)
+                self.send_outbox()
+            else:
+                retry_later(error)
+
+        def retry_later(_):
+            self.update_outbox_label(len(entries))
+            self.outbox_timer.start()
+
+        self.sending = True
+        self.rpc.run(
+            lambda server: server.add_submission(
+                entry['exam_id'], entry['question_id'], entry['answer'], token,
+                entry.get('request_key', '')),
+            finished, failed)
+
+    def update_outbox_label(self, count):
+        """
+        Shows number of answers that could not be sent.
+        """
+        self.outbox_label.setText(
+            'Нет связи с сервером. Ответов ожидает отправки: ' + str(count))
+        self.outbox_label.setVisible(count > 0)
 
 
 if __name__ == "__main__":
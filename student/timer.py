@@ -3,22 +3,38 @@ Contains timer.
 """
 
 
+from math import ceil
+from time import monotonic
 from PyQt5 import Qt
 
 
+TICK = 200
+
+
 class Timer:
     """
-    Timer.
+    Countdown to the deadline driven by one repeating timer.
+    Remaining time is computed from the monotonic clock, so delays of ticks do not add up.
+    Deadline is anchored using clock, function that returns current time of the server.
     """
-    def __init__(self):
-        self.current_time = -1
+    def __init__(self, clock):
+        self.clock = clock
+        self.timer = Qt.QTimer()
+        self.timer.setInterval(TICK)
+        self.timer.timeout.connect(self.update)
+        self.end = None
+        self.deadline = None
+        self.func = None
         self.timer_label = None
+        self.shown_time = None
 
     def tie(self, timer_label):
         """
         Ties timer with timer_label.
         """
         self.timer_label = timer_label
+        self.shown_time = None
+        self.update()
 
     def untie(self):
         """
@@ -26,37 +42,66 @@ class Timer:
         """
         self.timer_label = None
 
-    def update(self, func):
+    def remaining(self):
         """
-        Updates timer every second.
+        Returns remaining time in seconds.
         """
-        if self.current_time == 0:
-            func()
+        return max(0, ceil(self.deadline - monotonic()))
+
+    def update(self):
+        """
+        Updates timer_label and calls func when the time is over.
+        """
+        if self.deadline is None:
             return
-        self.current_time -= 1
-        hours = self.current_time // 3600
-        minutes = self.current_time % 3600 // 60
-        seconds = self.current_time % 60
-        try:
-            self.timer_label.setText('%02d:%02d:%02d' % (hours, minutes, seconds))
-            if self.current_time <= 10:
-                self.timer_label.setStyleSheet('color: red')
-            Qt.QTimer().singleShot(1000, lambda: self.update(func))
-        except RuntimeError:
+        current_time = self.remaining()
+        if self.timer_label is not None and current_time != self.shown_time:
+            hours = current_time // 3600
+            minutes = current_time % 3600 // 60
+            seconds = current_time % 60
+            try:
+                self.timer_label.setText('%02d:%02d:%02d' % (hours, minutes, seconds))
+                if current_time <= 10:
+                    self.timer_label.setStyleSheet('color: red')
+                self.shown_time = current_time
+            except RuntimeError:
+                self.untie()
+        if current_time == 0:
+            func = self.func
+            self.reset()
+            func()
+
+    def start(self, end, func):
+        """
+        Starts countdown to end (timestamp in seconds), func is called when the time is over.
+        Countdown is kept if the timer is already started with this end.
+        """
+        self.func = func
+        if self.deadline is not None and self.end == end:
             return
+        self.end = end
+        self.deadline = monotonic() + (end - self.clock())
+        self.timer.start()
 
-    def start(self, duration, func):
+    def resync(self):
         """
-        Starts timer.
+        Anchors the deadline again after the clock was corrected.
         """
-        self.current_time = duration
-        self.update(func)
+        if self.deadline is not None:
+            self.deadline = monotonic() + (self.end - self.clock())
+            self.update()
 
     def reset(self):
         """
         Resets timer.
         """
-        self.current_time = -1
+        self.timer.stop()
+        self.end = None
+        self.deadline = None
+        self.func = None
         if self.timer_label is not None:
-            self.timer_label.setText('')
+            try:
+                self.timer_label.setText('')
+            except RuntimeError:
+                pass
             self.timer_label = None
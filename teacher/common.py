@@ -4,9 +4,52 @@ Contains common functions and variables.
 
 
 import os
+import functools
+from time import perf_counter
 from PyQt5 import Qt
 
 
+@functools.lru_cache(maxsize=None)
+def font(size, weight=-1, italic=False):
+    """
+    Returns shared font of the size.
+    """
+    return Qt.QFont('Arial', size, weight, italic)
+
+
+@functools.lru_cache(maxsize=None)
+def pixmap(path):
+    """
+    Returns pixmap loaded from the path once.
+    """
+    return Qt.QPixmap(path)
+
+
+@functools.lru_cache(maxsize=None)
+def icon(path):
+    """
+    Returns icon loaded from the path once.
+    """
+    return Qt.QIcon(path)
+
+
+def timed(function):
+    """
+    Prints duration of the function calls if TIMING is set.
+    """
+    if not TIMING:
+        return function
+
+    @functools.wraps(function)
+    def result(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            print('%s: %.1f ms' % (function.__qualname__, (perf_counter() - start) * 1000))
+    return result
+
+
 def return_lambda(function, *args, **kwargs):
     """
     Returns lambda: function(*args, **kwargs)
@@ -14,27 +57,14 @@ def return_lambda(function, *args, **kwargs):
     return lambda: function(*args, **kwargs)
 
 
-def upper_question_style(equal):
+def set_style_property(widget, name, value):
     """
-    Returns style of current question depending on the result.
+    Sets dynamic property used by the style sheet, the widget is repolished only if it changed.
     """
-    background_color = 'white'
-    foreground_color = 'black'
-    border_color = 'grey'
-    if equal:
-        foreground_color = 'blue'
-        background_color = '#CCE8FF'
-        border_color = '#99D1FF'
-    return (
-        'color: ' + foreground_color + ';'
-        'background: ' + background_color + ';'
-        'border-style: solid;'
-        'border-width: 1px;'
-        'border-color: ' + border_color + ';'
-        'border-radius: 5px;'
-        'padding: 5px;'
-        'font-size: 27px;'
-    )
+    if widget.property(name) != value:
+        widget.setProperty(name, value)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
 
 
 def main_question_style(question_result):
@@ -43,16 +73,19 @@ def main_question_style(question_result):
     """
     if not question_result:
         main_color = RED
-        main_picture = Qt.QPixmap(CROSS)
+        main_picture = pixmap(CROSS)
     elif question_result['share'] == -1:
         main_color = YELLOW
-        main_picture = Qt.QPixmap(WARNING)
+        main_picture = pixmap(WARNING)
     elif question_result['share'] == 1:
         main_color = GREEN
-        main_picture = Qt.QPixmap(TICK)
+        main_picture = pixmap(TICK)
+    elif question_result['share'] > 0:
+        main_color = LIME
+        main_picture = pixmap(TICK)
     else:
         main_color = RED
-        main_picture = Qt.QPixmap(CROSS)
+        main_picture = pixmap(CROSS)
     return {
         'main_color': main_color,
         'main_picture': main_picture
@@ -78,9 +111,13 @@ def get_question_details(question_result):
     }
 
 
+EXAMS_PAGE_SIZE = 50
+EXPORT_CHUNK_SIZE = 200
+TIMING = bool(os.environ.get('EXAMINER_TIMING'))
 GREEN = '#6DC180'
 RED = '#FF6643'
 YELLOW = '#FFA500'
+LIME = '#A8B820'
 GREY = '#546A74'
 USER = os.path.join('images', 'user.png')
 EXAM30 = os.path.join('images', 'exam-30x30.png')
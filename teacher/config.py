@@ -0,0 +1,70 @@
+"""
+Contains settings of the client.
+"""
+
+
+import os
+import json
+
+
+class Config:
+    """
+    Settings loaded from json file once and kept in memory.
+    File is rewritten atomically only when settings change,
+    external edits are noticed by modification time of the file.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.data = {}
+        self.mtime = None
+        self.load()
+
+    def load(self):
+        """
+        Loads settings from the file.
+        """
+        with open(self.path, encoding='utf-8') as file:
+            self.data = json.load(file)
+        self.mtime = os.stat(self.path).st_mtime_ns
+
+    def save(self):
+        """
+        Saves settings to the file atomically.
+        """
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(self.data, file, ensure_ascii=False, indent=4)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.path)
+        self.mtime = os.stat(self.path).st_mtime_ns
+
+    def reload(self):
+        """
+        Reloads settings if the file was changed by another program.
+        Returns True if settings were reloaded.
+        """
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return False
+        if mtime == self.mtime:
+            return False
+        try:
+            self.load()
+        except (OSError, ValueError):
+            self.mtime = mtime
+            return False
+        return True
+
+    def update(self, data):
+        """
+        Updates settings with data, the file is saved only if something changed.
+        Returns True if settings changed.
+        """
+        changed = {key: value for key, value in data.items() if self.data.get(key) != value}
+        if not changed:
+            return False
+        self.data.update(changed)
+        self.save()
+        return True
@@ -4,6 +4,7 @@ Widget to display data error.
 
 
 from PyQt5 import Qt
+import common
 
 
 class ErrorWidget(Qt.QWidget):
@@ -16,7 +17,7 @@ class ErrorWidget(Qt.QWidget):
         error_title = Qt.QLabel(
             'Произошла ошибка при чтении данных. Возможно, эти данные удалены или недействительны.',
             self)
-        error_title.setFont(Qt.QFont('Arial', 25))
+        error_title.setFont(common.font(25))
         error_title.setWordWrap(True)
 
         layout = Qt.QVBoxLayout()
@@ -11,6 +11,7 @@ class ExamPage(Qt.QWidget):
     """
     Exam page for teacher.
     """
+    @common.timed
     def __init__(self, app, exam_id):
         super().__init__()
         self.app = app
@@ -20,8 +21,9 @@ class ExamPage(Qt.QWidget):
         self.exam_data = None
         self.question_data = None
         self.questions_ids = []
+        self.buttons_ids = []
 
-        back_button = Qt.QPushButton(Qt.QIcon(common.LEFT), '', self)
+        back_button = Qt.QPushButton(common.icon(common.LEFT), '', self)
         back_button.setObjectName('Flat')
         back_button.setCursor(Qt.Qt.PointingHandCursor)
         back_button.setIconSize(Qt.QSize(35, 35))
@@ -33,8 +35,8 @@ class ExamPage(Qt.QWidget):
         scroll_area.setFrameShape(Qt.QFrame.NoFrame)
         scroll_area.setSizePolicy(Qt.QSizePolicy.Minimum, Qt.QSizePolicy.Minimum)
 
-        self.settings_button = Qt.QPushButton(Qt.QIcon(common.SETTINGS), '', self)
-        self.settings_button.setObjectName('Flat')
+        self.settings_button = Qt.QPushButton(common.icon(common.SETTINGS), '', self)
+        self.settings_button.setObjectName('Question')
         self.settings_button.setCursor(Qt.Qt.PointingHandCursor)
         self.settings_button.setIconSize(Qt.QSize(30, 30))
         self.settings_button.setFixedSize(Qt.QSize(50, 50))
@@ -44,13 +46,13 @@ class ExamPage(Qt.QWidget):
         self.questions_layout.setSpacing(0)
 
         short_question_action = Qt.QWidgetAction(self)
-        short_question_action.setFont(Qt.QFont('Arial', 15))
+        short_question_action.setFont(common.font(15))
         short_question_action.setText('Вопрос с кратким ответом')
         short_question_action.triggered.connect(
             lambda: self.app.create_question(self.exam_id, 'Short'))
 
         long_question_action = Qt.QWidgetAction(self)
-        long_question_action.setFont(Qt.QFont('Arial', 15))
+        long_question_action.setFont(common.font(15))
         long_question_action.setText('Вопрос с развёрнутым ответом')
         long_question_action.triggered.connect(
             lambda: self.app.create_question(self.exam_id, 'Long'))
@@ -59,12 +61,12 @@ class ExamPage(Qt.QWidget):
         create_menu.addAction(short_question_action)
         create_menu.addAction(long_question_action)
 
-        create_button = Qt.QPushButton(Qt.QIcon(common.CREATE), '', self)
-        create_button.setObjectName('Flat')
-        create_button.setCursor(Qt.Qt.PointingHandCursor)
-        create_button.setIconSize(Qt.QSize(40, 40))
-        create_button.setFixedSize(Qt.QSize(50, 50))
-        create_button.setMenu(create_menu)
+        self.create_button = Qt.QPushButton(common.icon(common.CREATE), '', self)
+        self.create_button.setObjectName('Flat')
+        self.create_button.setCursor(Qt.Qt.PointingHandCursor)
+        self.create_button.setIconSize(Qt.QSize(40, 40))
+        self.create_button.setFixedSize(Qt.QSize(50, 50))
+        self.create_button.setMenu(create_menu)
 
         self.widget = Qt.QWidget(self)
 
@@ -75,7 +77,7 @@ class ExamPage(Qt.QWidget):
         scroll_layout.addWidget(self.settings_button)
         scroll_layout.addLayout(self.questions_layout)
         scroll_layout.addSpacerItem(Qt.QSpacerItem(5, 0))
-        scroll_layout.addWidget(create_button)
+        scroll_layout.addWidget(self.create_button)
         scroll_layout.addStretch(1)
 
         scroll_widget = Qt.QWidget(self)
@@ -93,6 +95,7 @@ class ExamPage(Qt.QWidget):
         layout.addWidget(self.widget)
         self.setLayout(layout)
 
+    @common.timed
     def display_current_question(self):
         """
         Displays current question.
@@ -115,24 +118,36 @@ class ExamPage(Qt.QWidget):
 
     def refresh(self):
         """
-        Refreshes upper panel.
+        Refreshes upper panel, buttons are recreated only if the list of questions changed.
+        Questions of the archived exam can't be created.
         """
-        self.settings_button.setStyleSheet(common.upper_question_style(self.question_id is None))
+        common.set_style_property(self.settings_button, 'current', self.question_id is None)
+        self.create_button.setDisabled(bool(self.exam_data and self.exam_data['archived']))
+        if self.buttons_ids != self.questions_ids:
+            self.create_buttons()
         self.question_number = None
+        for question in range(len(self.questions_ids)):
+            question_id = self.questions_ids[question]
+            if question_id == self.question_id:
+                self.question_number = question + 1
+            common.set_style_property(
+                self.questions_layout.itemAt(question).widget(),
+                'current', question_id == self.question_id)
+
+    def create_buttons(self):
+        """
+        Creates buttons for questions on the upper panel.
+        """
         while self.questions_layout.count() > 0:
             old_widget = self.questions_layout.itemAt(0).widget()
             old_widget.deleteLater()
             self.questions_layout.removeWidget(old_widget)
         for question in range(len(self.questions_ids)):
-            question_id = self.questions_ids[question]
-            if question_id == self.question_id:
-                self.question_number = question + 1
             question_button = Qt.QPushButton(str(question + 1), self)
-            question_button.setObjectName('Flat')
+            question_button.setObjectName('Question')
             question_button.setCursor(Qt.Qt.PointingHandCursor)
             question_button.setFixedSize(Qt.QSize(50, 50))
             question_button.clicked.connect(
-                common.return_lambda(self.app.view_exam_question, question_id))
-            question_button.setStyleSheet(
-                common.upper_question_style(question_id == self.question_id))
+                common.return_lambda(self.app.view_exam_question, self.questions_ids[question]))
             self.questions_layout.addWidget(question_button)
+        self.buttons_ids = list(self.questions_ids)
@@ -17,41 +17,67 @@ class ExamSettings(ExamWidgetBase):
         self.exam_data = parent.exam_data
 
         settings_title = Qt.QLabel('Настройки экзамена', self)
-        settings_title.setFont(Qt.QFont('Arial', 30))
+        settings_title.setFont(common.font(30))
 
         name_title = Qt.QLabel('Название экзамена:', self)
-        name_title.setFont(Qt.QFont('Arial', 20))
+        name_title.setFont(common.font(20))
 
         self.name_input = Qt.QLineEdit(self.exam_data['name'], self)
-        self.name_input.setFont(Qt.QFont('Arial', 20))
+        self.name_input.setFont(common.font(20))
         self.name_input.setCursorPosition(0)
         self.name_input.textChanged.connect(self.update_status)
 
         duration_title = Qt.QLabel('Продолжительность (в минутах):', self)
-        duration_title.setFont(Qt.QFont('Arial', 20))
+        duration_title.setFont(common.font(20))
 
         self.duration_input = Qt.QLineEdit(str(self.exam_data['duration']), self)
-        self.duration_input.setFont(Qt.QFont('Arial', 20))
+        self.duration_input.setFont(common.font(20))
         self.duration_input.textChanged.connect(self.update_status)
 
         state_title = Qt.QLabel('Для участия:', self)
-        state_title.setFont(Qt.QFont('Arial', 20))
+        state_title.setFont(common.font(20))
 
         self.state_box = Qt.QComboBox(self)
-        self.state_box.setFont(Qt.QFont('Arial', 20))
+        self.state_box.setFont(common.font(20))
         self.state_box.addItems(['Недоступен', 'Открыт'])
         self.state_box.setCurrentIndex(self.exam_data['published'])
         self.state_box.currentIndexChanged.connect(self.update_status)
 
         results_button = Qt.QPushButton('Таблица результатов', self)
         results_button.setObjectName('Button')
-        results_button.setFont(Qt.QFont('Arial', 20))
+        results_button.setFont(common.font(20))
         results_button.clicked.connect(lambda: app.display_results_page(self.exam_data['rowid']))
 
-        self.save_button = Qt.QPushButton(Qt.QIcon(common.SAVE), 'Сохранить', self)
+        export_button = Qt.QPushButton('Экспорт', self)
+        export_button.setObjectName('Button')
+        export_button.setFont(common.font(20))
+        export_button.clicked.connect(lambda: app.export_exam(self.exam_data['rowid']))
+
+        clone_group_input = Qt.QLineEdit(self)
+        clone_group_input.setFont(common.font(20))
+        clone_group_input.setPlaceholderText('Группа (по умолчанию своя)')
+
+        clone_button = Qt.QPushButton('Копировать', self)
+        clone_button.setObjectName('Button')
+        clone_button.setFont(common.font(20))
+        clone_button.clicked.connect(
+            lambda: app.clone_exam(self.exam_data['rowid'], clone_group_input.text()))
+
+        self.action_label = Qt.QLabel(self)
+        self.action_label.setFont(common.font(20))
+
+        archive_button = Qt.QPushButton('В архив', self)
+        archive_button.setObjectName('Button')
+        archive_button.setFont(common.font(20))
+        archive_button.clicked.connect(lambda: app.display_confirm_page(
+            'Экзамен будет перенесён в архив и станет доступен только для просмотра. Продолжить?',
+            lambda: app.display_exam(self.exam_data['rowid']),
+            lambda: app.archive_exam(self.exam_data['rowid'])))
+
+        self.save_button = Qt.QPushButton(common.icon(common.SAVE), 'Сохранить', self)
         self.save_button.setObjectName('Button')
         self.save_button.setIconSize(Qt.QSize(35, 35))
-        self.save_button.setFont(Qt.QFont('Arial', 20))
+        self.save_button.setFont(common.font(20))
         self.save_button.clicked.connect(lambda: app.save_exam_data(
             {
                 'rowid': self.exam_data['rowid'],
@@ -66,13 +92,13 @@ class ExamSettings(ExamWidgetBase):
         self.status_img.setFixedSize(Qt.QSize(50, 50))
 
         self.status_label = Qt.QLabel(self)
-        self.status_label.setFont(Qt.QFont('Arial', 20))
+        self.status_label.setFont(common.font(20))
         self.update_status()
 
-        delete_button = Qt.QPushButton(Qt.QIcon(common.DELETE), 'Удалить экзамен', self)
+        delete_button = Qt.QPushButton(common.icon(common.DELETE), 'Удалить экзамен', self)
         delete_button.setObjectName('Button')
         delete_button.setIconSize(Qt.QSize(35, 35))
-        delete_button.setFont(Qt.QFont('Arial', 20))
+        delete_button.setFont(common.font(20))
         delete_button.clicked.connect(lambda: app.display_confirm_page(
             'Вы уверены, что хотите удалить этот экзамен?',
             lambda: app.display_exam(self.exam_data['rowid']),
@@ -100,8 +126,20 @@ class ExamSettings(ExamWidgetBase):
 
         results_layout = Qt.QHBoxLayout()
         results_layout.addWidget(results_button)
+        results_layout.addSpacerItem(Qt.QSpacerItem(20, 0))
+        results_layout.addWidget(export_button)
+        results_layout.addSpacerItem(Qt.QSpacerItem(20, 0))
+        results_layout.addWidget(archive_button)
         results_layout.addStretch(1)
 
+        clone_layout = Qt.QHBoxLayout()
+        clone_layout.addWidget(clone_button)
+        clone_layout.addSpacerItem(Qt.QSpacerItem(20, 0))
+        clone_layout.addWidget(clone_group_input)
+        clone_layout.addSpacerItem(Qt.QSpacerItem(20, 0))
+        clone_layout.addWidget(self.action_label)
+        clone_layout.addStretch(1)
+
         self.lower_layout.addWidget(self.save_button)
         self.lower_layout.addSpacerItem(Qt.QSpacerItem(20, 0))
         self.lower_layout.addWidget(self.status_img)
@@ -110,11 +148,18 @@ class ExamSettings(ExamWidgetBase):
         self.lower_layout.addStretch(1)
         self.lower_layout.addWidget(delete_button)
 
+        if self.exam_data['archived']:
+            settings_title.setText('Настройки экзамена (в архиве)')
+            for widget in (self.name_input, self.duration_input, archive_button):
+                widget.setDisabled(True)
+
         self.layout.addWidget(settings_title)
         self.layout.addSpacerItem(Qt.QSpacerItem(0, 40))
         self.layout.addLayout(main_layout)
         self.layout.addSpacerItem(Qt.QSpacerItem(0, 40))
         self.layout.addLayout(results_layout)
+        self.layout.addSpacerItem(Qt.QSpacerItem(0, 20))
+        self.layout.addLayout(clone_layout)
         self.layout.addStretch(1)
 
     def update_status(self):
@@ -128,11 +173,11 @@ class ExamSettings(ExamWidgetBase):
         saved_duration = str(self.exam_data['duration'])
         saved_state = self.exam_data['published']
         if saved_name != name or saved_duration != duration or saved_state != state:
-            self.status_img.setPixmap(Qt.QPixmap(common.WARNING))
+            self.status_img.setPixmap(common.pixmap(common.WARNING))
             self.status_label.setText('Сохраните')
             self.status_label.setStyleSheet('color: ' + common.YELLOW)
         else:
-            self.status_img.setPixmap(Qt.QPixmap(common.TICK))
+            self.status_img.setPixmap(common.pixmap(common.TICK))
             self.status_label.setText('Сохранено')
             self.status_label.setStyleSheet('color: ' + common.GREEN)
         if saved_name != name:
@@ -149,9 +194,16 @@ class ExamSettings(ExamWidgetBase):
             self.state_box.setStyleSheet('border-color: ' + common.GREEN)
         if len(duration) > 9 or not duration.isdigit() or int(duration) == 0:
             self.duration_input.setStyleSheet('border-color: ' + common.RED)
-            self.status_img.setPixmap(Qt.QPixmap(common.CROSS))
+            self.status_img.setPixmap(common.pixmap(common.CROSS))
             self.status_label.setText('Недопустимо')
             self.status_label.setStyleSheet('color: ' + common.RED)
             self.save_button.setDisabled(True)
         else:
             self.save_button.setEnabled(True)
+
+    def set_action_state(self, status, succeeded):
+        """
+        Shows result of copying or archiving the exam.
+        """
+        self.action_label.setText(status)
+        self.action_label.setStyleSheet('color: ' + (common.GREEN if succeeded else common.RED))
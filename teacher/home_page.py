@@ -11,83 +11,89 @@ class HomePage(Qt.QWidget):
     """
     Teacher's home page.
     """
-    def __init__(self, app, group_name, list_of_exams):
+    def __init__(self, app, group_name, exams_page, name_filter):
         super().__init__()
+        self.app = app
+        self.name_filter = name_filter
+        self.cursor = exams_page['cursor']
 
-        update_button = Qt.QPushButton(Qt.QIcon(common.UPDATE), '', self)
+        update_button = Qt.QPushButton(common.icon(common.UPDATE), '', self)
         update_button.setObjectName('Flat')
         update_button.setCursor(Qt.Qt.PointingHandCursor)
         update_button.setIconSize(Qt.QSize(35, 35))
         update_button.setFixedSize(Qt.QSize(55, 55))
-        update_button.clicked.connect(lambda _: app.display_home_page())
+        update_button.clicked.connect(lambda _: app.update_home_page(self.name_filter))
 
         exams_title = Qt.QLabel('Экзамены группы ' + group_name, self)
-        exams_title.setFont(Qt.QFont('Arial', 30))
+        exams_title.setFont(common.font(30))
 
         view_profile_action = Qt.QWidgetAction(self)
-        view_profile_action.setFont(Qt.QFont('Arial', 15))
+        view_profile_action.setFont(common.font(15))
         view_profile_action.setText('Профиль')
         view_profile_action.triggered.connect(lambda _: app.display_profile_page())
 
+        import_action = Qt.QWidgetAction(self)
+        import_action.setFont(common.font(15))
+        import_action.setText('Импорт учеников')
+        import_action.triggered.connect(lambda _: app.display_import_page())
+
         exit_action = Qt.QWidgetAction(self)
-        exit_action.setFont(Qt.QFont('Arial', 15))
+        exit_action.setFont(common.font(15))
         exit_action.setText('Выйти')
         exit_action.triggered.connect(lambda _: app.logout())
 
         user_menu = Qt.QMenu(self)
         user_menu.addAction(view_profile_action)
+        user_menu.addAction(import_action)
         user_menu.addAction(exit_action)
 
-        user_button = Qt.QPushButton(Qt.QIcon(common.USER), '', self)
+        user_button = Qt.QPushButton(common.icon(common.USER), '', self)
         user_button.setObjectName('Flat')
         user_button.setCursor(Qt.Qt.PointingHandCursor)
         user_button.setIconSize(Qt.QSize(35, 35))
         user_button.setFixedSize(Qt.QSize(55, 55))
         user_button.setMenu(user_menu)
 
+        filter_input = Qt.QLineEdit(name_filter, self)
+        filter_input.setFont(common.font(20))
+        filter_input.setPlaceholderText('Поиск по названию')
+        filter_input.returnPressed.connect(lambda: app.display_home_page(filter_input.text()))
+
         scroll_area = Qt.QScrollArea()
         scroll_area.setFrameShape(Qt.QFrame.NoFrame)
+        self.scroll_bar = scroll_area.verticalScrollBar()
+        self.scroll_bar.valueChanged.connect(self.check_scroll)
 
-        scroll_layout = Qt.QVBoxLayout()
-        scroll_layout.setSizeConstraint(Qt.QLayout.SetMinimumSize)
-
-        for exam in list_of_exams:
-            exam_id = exam['rowid']
-            exam_name = exam['name']
-
-            exam_button = Qt.QPushButton(Qt.QIcon(common.EXAM30), exam_name, self)
-            exam_button.setObjectName('Flat')
-            exam_button.setCursor(Qt.Qt.PointingHandCursor)
-            exam_button.setIconSize(Qt.QSize(30, 30))
-            exam_button.setFont(Qt.QFont('Arial', 20))
-            exam_button.clicked.connect(common.return_lambda(app.display_exam, exam_id))
-
-            exam_layout = Qt.QHBoxLayout()
-            exam_layout.addWidget(exam_button)
-            exam_layout.addStretch(1)
-
-            scroll_layout.addLayout(exam_layout)
-
-        scroll_layout.addStretch(1)
+        self.scroll_layout = Qt.QVBoxLayout()
+        self.scroll_layout.setSizeConstraint(Qt.QLayout.SetMinimumSize)
+        self.scroll_layout.addStretch(1)
+        self.add_exams(exams_page['exams'])
 
         scroll_widget = Qt.QWidget(self)
-        scroll_widget.setLayout(scroll_layout)
+        scroll_widget.setLayout(self.scroll_layout)
         scroll_area.setWidget(scroll_widget)
 
-        create_button = Qt.QPushButton(Qt.QIcon(common.CREATE), 'Создать экзамен', self)
+        create_button = Qt.QPushButton(common.icon(common.CREATE), 'Создать экзамен', self)
         create_button.setObjectName('Button')
         create_button.setIconSize(Qt.QSize(35, 35))
-        create_button.setFont(Qt.QFont('Arial', 20))
+        create_button.setFont(common.font(20))
         create_button.clicked.connect(lambda _: app.create_exam())
 
-        info_label = Qt.QLabel('Всего экзаменов - ' + str(len(list_of_exams)), self)
-        info_label.setFont(Qt.QFont('Arial', 20))
+        import_button = Qt.QPushButton('Импорт экзамена', self)
+        import_button.setObjectName('Button')
+        import_button.setFont(common.font(20))
+        import_button.clicked.connect(lambda _: app.import_exam())
+
+        self.info_label = Qt.QLabel('Всего экзаменов - ' + str(exams_page['total']), self)
+        self.info_label.setFont(common.font(20))
 
         lower_layout = Qt.QHBoxLayout()
         lower_layout.addWidget(create_button)
+        lower_layout.addSpacerItem(Qt.QSpacerItem(20, 0))
+        lower_layout.addWidget(import_button)
         lower_layout.addStretch(1)
         lower_layout.addSpacerItem(Qt.QSpacerItem(10, 0))
-        lower_layout.addWidget(info_label)
+        lower_layout.addWidget(self.info_label)
         lower_layout.addSpacerItem(Qt.QSpacerItem(10, 0))
 
         upper_layout = Qt.QHBoxLayout()
@@ -100,7 +106,53 @@ class HomePage(Qt.QWidget):
         layout = Qt.QVBoxLayout()
         layout.addLayout(upper_layout)
         layout.addSpacerItem(Qt.QSpacerItem(0, 20))
+        layout.addWidget(filter_input)
+        layout.addSpacerItem(Qt.QSpacerItem(0, 10))
         layout.addWidget(scroll_area)
         layout.addSpacerItem(Qt.QSpacerItem(0, 10))
         layout.addLayout(lower_layout)
         self.setLayout(layout)
+
+    def add_exams(self, list_of_exams):
+        """
+        Adds buttons for exams to the end of the list.
+        """
+        for exam in list_of_exams:
+            exam_id = exam['rowid']
+            exam_name = exam['name']
+
+            exam_button = Qt.QPushButton(common.icon(common.EXAM30), exam_name, self)
+            exam_button.setObjectName('Flat')
+            exam_button.setCursor(Qt.Qt.PointingHandCursor)
+            exam_button.setIconSize(Qt.QSize(30, 30))
+            exam_button.setFont(common.font(20))
+            exam_button.clicked.connect(common.return_lambda(self.app.display_exam, exam_id))
+
+            exam_layout = Qt.QHBoxLayout()
+            exam_layout.addWidget(exam_button)
+            exam_layout.addStretch(1)
+
+            self.scroll_layout.insertLayout(self.scroll_layout.count() - 1, exam_layout)
+
+    def check_scroll(self, value):
+        """
+        Loads next exams when the list is scrolled to the end.
+        """
+        if self.cursor is not False and value >= self.scroll_bar.maximum() - 50:
+            cursor = self.cursor
+            self.cursor = False
+            self.app.load_more_exams(cursor)
+
+    def extend(self, exams_page):
+        """
+        Appends the next page of exams.
+        """
+        self.cursor = exams_page['cursor']
+        self.add_exams(exams_page['exams'])
+
+    def set_failed_state(self, status):
+        """
+        Sets failed state.
+        """
+        self.info_label.setText(status)
+        self.info_label.setStyleSheet('color: ' + common.RED)
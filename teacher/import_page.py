@@ -0,0 +1,97 @@
+"""
+Page to import students from file.
+"""
+
+
+from PyQt5 import Qt
+import common
+
+
+class ImportPage(Qt.QWidget):
+    """
+    Page to import students from file.
+    """
+    def __init__(self, app):
+        super().__init__()
+
+        back_button = Qt.QPushButton(common.icon(common.LEFT), '', self)
+        back_button.setObjectName('Flat')
+        back_button.setCursor(Qt.Qt.PointingHandCursor)
+        back_button.setIconSize(Qt.QSize(35, 35))
+        back_button.setFixedSize(Qt.QSize(55, 55))
+        back_button.clicked.connect(lambda _: app.display_home_page())
+
+        import_title = Qt.QLabel('Импорт учеников', self)
+        import_title.setFont(common.font(30))
+
+        info_label = Qt.QLabel(
+            'Выберите файл CSV, в каждой строке которого указаны логин и пароль ученика, '
+            'например: Иван Иванов;12345. Ученики будут добавлены в вашу группу.', self)
+        info_label.setFont(common.font(20))
+        info_label.setWordWrap(True)
+
+        import_button = Qt.QPushButton(common.icon(common.CREATE), 'Выбрать файл', self)
+        import_button.setObjectName('Button')
+        import_button.setIconSize(Qt.QSize(35, 35))
+        import_button.setFont(common.font(20))
+        import_button.clicked.connect(lambda _: app.import_students())
+
+        self.status_label = Qt.QLabel(self)
+        self.status_label.setFont(common.font(20))
+        self.status_label.setWordWrap(True)
+        self.status_label.setMinimumWidth(380)
+
+        self.report_input = Qt.QPlainTextEdit(self)
+        self.report_input.setFont(common.font(15))
+        self.report_input.setReadOnly(True)
+        self.report_input.hide()
+
+        upper_layout = Qt.QHBoxLayout()
+        upper_layout.addWidget(back_button)
+        upper_layout.addStretch(1)
+        upper_layout.addWidget(import_title)
+        upper_layout.addStretch(1)
+
+        button_layout = Qt.QHBoxLayout()
+        button_layout.addWidget(import_button)
+        button_layout.addSpacerItem(Qt.QSpacerItem(20, 0))
+        button_layout.addWidget(self.status_label)
+        button_layout.addStretch(1)
+
+        layout = Qt.QVBoxLayout()
+        layout.addLayout(upper_layout)
+        layout.addSpacerItem(Qt.QSpacerItem(0, 40))
+        layout.addWidget(info_label)
+        layout.addSpacerItem(Qt.QSpacerItem(0, 20))
+        layout.addLayout(button_layout)
+        layout.addSpacerItem(Qt.QSpacerItem(0, 20))
+        layout.addWidget(self.report_input)
+        layout.addStretch(1)
+        self.setLayout(layout)
+
+    def set_waiting_state(self):
+        """
+        Sets waiting state.
+        """
+        self.setCursor(Qt.Qt.WaitCursor)
+        self.status_label.setText('Подождите...')
+        self.status_label.setStyleSheet('color: black')
+        self.status_label.repaint()
+
+    def set_failed_state(self, status):
+        """
+        Sets failed state.
+        """
+        self.setCursor(Qt.Qt.ArrowCursor)
+        self.status_label.setText(status)
+        self.status_label.setStyleSheet('color: ' + common.RED)
+
+    def set_succeeded_state(self, status, conflicts):
+        """
+        Sets succeeded state and shows the rows that were not imported.
+        """
+        self.setCursor(Qt.Qt.ArrowCursor)
+        self.status_label.setText(status)
+        self.status_label.setStyleSheet('color: ' + common.GREEN)
+        self.report_input.setPlainText('\n'.join(conflicts))
+        self.report_input.setVisible(bool(conflicts))
@@ -15,21 +15,21 @@ class LoginPage(Qt.QWidget):
         super().__init__()
 
         enter_title = Qt.QLabel('Вход в систему', self)
-        enter_title.setFont(Qt.QFont('Arial', 30))
+        enter_title.setFont(common.font(30))
         enter_title.setAlignment(Qt.Qt.AlignCenter)
 
         user_title = Qt.QLabel('Логин:', self)
-        user_title.setFont(Qt.QFont('Arial', 20))
+        user_title.setFont(common.font(20))
 
         user_input = Qt.QLineEdit(app.client.user_name, self)
-        user_input.setFont(Qt.QFont('Arial', 20))
+        user_input.setFont(common.font(20))
         user_input.setMinimumWidth(400)
 
         password_title = Qt.QLabel('Пароль:', self)
-        password_title.setFont(Qt.QFont('Arial', 20))
+        password_title.setFont(common.font(20))
 
         password_input = Qt.QLineEdit(self)
-        password_input.setFont(Qt.QFont('Arial', 20))
+        password_input.setFont(common.font(20))
         password_input.setMinimumWidth(400)
         password_input.setEchoMode(Qt.QLineEdit.Password)
         if app.client.get_data()['autofill']:
@@ -37,17 +37,17 @@ class LoginPage(Qt.QWidget):
 
         enter_button = Qt.QPushButton('Войти в систему', self)
         enter_button.setObjectName('Button')
-        enter_button.setFont(Qt.QFont('Arial', 20))
+        enter_button.setFont(common.font(20))
         enter_button.clicked.connect(lambda: app.login(user_input.text(), password_input.text()))
         password_input.returnPressed.connect(enter_button.click)
         user_input.returnPressed.connect(enter_button.click)
 
         self.status_label = Qt.QLabel(self)
-        self.status_label.setFont(Qt.QFont('Arial', 20))
+        self.status_label.setFont(common.font(20))
         self.status_label.setWordWrap(True)
         self.status_label.setMinimumWidth(270)
 
-        settings_button = Qt.QPushButton(Qt.QIcon(common.SETTINGS), '', self)
+        settings_button = Qt.QPushButton(common.icon(common.SETTINGS), '', self)
         settings_button.setObjectName('Flat')
         settings_button.setCursor(Qt.Qt.PointingHandCursor)
         settings_button.setIconSize(Qt.QSize(35, 35))
@@ -57,7 +57,7 @@ class LoginPage(Qt.QWidget):
         register_button = Qt.QPushButton('Регистрация', self)
         register_button.setObjectName('Flat')
         register_button.setCursor(Qt.Qt.PointingHandCursor)
-        register_button.setFont(Qt.QFont('Arial', 20))
+        register_button.setFont(common.font(20))
         register_button.clicked.connect(app.display_register_page)
         register_button.setStyleSheet('color: ' + common.GREY)
 
@@ -14,7 +14,7 @@ class NewGroupPage(Qt.QWidget):
     def __init__(self, app):
         super().__init__()
 
-        back_button = Qt.QPushButton(Qt.QIcon(common.LEFT), '', self)
+        back_button = Qt.QPushButton(common.icon(common.LEFT), '', self)
         back_button.setObjectName('Flat')
         back_button.setCursor(Qt.Qt.PointingHandCursor)
         back_button.setIconSize(Qt.QSize(35, 35))
@@ -22,24 +22,24 @@ class NewGroupPage(Qt.QWidget):
         back_button.clicked.connect(app.display_register_page)
 
         new_group_title = Qt.QLabel('Новая группа', self)
-        new_group_title.setFont(Qt.QFont('Arial', 30))
+        new_group_title.setFont(common.font(30))
 
         group_title = Qt.QLabel('Название группы:', self)
-        group_title.setFont(Qt.QFont('Arial', 20))
+        group_title.setFont(common.font(20))
 
         group_input = Qt.QLineEdit(self)
-        group_input.setFont(Qt.QFont('Arial', 20))
+        group_input.setFont(common.font(20))
         group_input.setMinimumWidth(400)
 
-        create_button = Qt.QPushButton(Qt.QIcon(common.CREATE), 'Создать группу', self)
+        create_button = Qt.QPushButton(common.icon(common.CREATE), 'Создать группу', self)
         create_button.setObjectName('Button')
         create_button.setIconSize(Qt.QSize(35, 35))
-        create_button.setFont(Qt.QFont('Arial', 20))
+        create_button.setFont(common.font(20))
         create_button.clicked.connect(lambda: app.create_group(group_input.text()))
         group_input.returnPressed.connect(create_button.click)
 
         self.status_label = Qt.QLabel(self)
-        self.status_label.setFont(Qt.QFont('Arial', 20))
+        self.status_label.setFont(common.font(20))
         self.status_label.setWordWrap(True)
         self.status_label.setMinimumWidth(380)
 
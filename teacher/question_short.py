@@ -17,32 +17,32 @@ class QuestionShortEdit(ExamWidgetBase):
         self.question_data = parent.question_data
 
         statement_title = Qt.QLabel('Текст вопроса:', self)
-        statement_title.setFont(Qt.QFont('Arial', 25))
+        statement_title.setFont(common.font(25))
 
         self.statement_input = Qt.QPlainTextEdit(self.question_data['statement'], self)
-        self.statement_input.setFont(Qt.QFont('Arial', 20))
+        self.statement_input.setFont(common.font(20))
         self.statement_input.setMinimumHeight(220)
         self.statement_input.textChanged.connect(self.update_status)
 
         answer_title = Qt.QLabel('Правильный ответ:', self)
-        answer_title.setFont(Qt.QFont('Arial', 25))
+        answer_title.setFont(common.font(25))
 
         self.answer_input = Qt.QLineEdit(self.question_data['correct'], self)
-        self.answer_input.setFont(Qt.QFont('Arial', 20))
+        self.answer_input.setFont(common.font(20))
         self.answer_input.setCursorPosition(0)
         self.answer_input.textChanged.connect(self.update_status)
 
         maxscore_title = Qt.QLabel('Максимальный балл:', self)
-        maxscore_title.setFont(Qt.QFont('Arial', 25))
+        maxscore_title.setFont(common.font(25))
 
         self.maxscore_input = Qt.QLineEdit(str(self.question_data['maxscore']), self)
-        self.maxscore_input.setFont(Qt.QFont('Arial', 20))
+        self.maxscore_input.setFont(common.font(20))
         self.maxscore_input.textChanged.connect(self.update_status)
 
-        self.save_button = Qt.QPushButton(Qt.QIcon(common.SAVE), 'Сохранить', self)
+        self.save_button = Qt.QPushButton(common.icon(common.SAVE), 'Сохранить', self)
         self.save_button.setObjectName('Button')
         self.save_button.setIconSize(Qt.QSize(35, 35))
-        self.save_button.setFont(Qt.QFont('Arial', 20))
+        self.save_button.setFont(common.font(20))
         self.save_button.clicked.connect(lambda: app.save_question_data(
             {
                 'rowid': self.question_data['rowid'],
@@ -59,13 +59,13 @@ class QuestionShortEdit(ExamWidgetBase):
         self.status_img.setFixedSize(Qt.QSize(50, 50))
 
         self.status_label = Qt.QLabel(self)
-        self.status_label.setFont(Qt.QFont('Arial', 20))
+        self.status_label.setFont(common.font(20))
         self.update_status()
 
-        delete_button = Qt.QPushButton(Qt.QIcon(common.DELETE), 'Удалить вопрос', self)
+        delete_button = Qt.QPushButton(common.icon(common.DELETE), 'Удалить вопрос', self)
         delete_button.setObjectName('Button')
         delete_button.setIconSize(Qt.QSize(35, 35))
-        delete_button.setFont(Qt.QFont('Arial', 20))
+        delete_button.setFont(common.font(20))
         delete_button.clicked.connect(lambda: app.delete_question(self.question_data['rowid']))
 
         title_layout = Qt.QVBoxLayout()
@@ -93,6 +93,12 @@ class QuestionShortEdit(ExamWidgetBase):
         self.lower_layout.addStretch(1)
         self.lower_layout.addWidget(delete_button)
 
+        if parent.exam_data and parent.exam_data['archived']:
+            statement_title.setText('Текст вопроса (экзамен в архиве):')
+            for widget in (self.statement_input, self.answer_input, self.maxscore_input,
+                           self.save_button, delete_button):
+                widget.setDisabled(True)
+
         self.layout.addWidget(statement_title)
         self.layout.addSpacerItem(Qt.QSpacerItem(0, 10))
         self.layout.addWidget(self.statement_input)
@@ -110,11 +116,11 @@ class QuestionShortEdit(ExamWidgetBase):
         saved_correct = self.question_data['correct']
         saved_maxscore = str(self.question_data['maxscore'])
         if saved_statement != statement or saved_correct != correct or saved_maxscore != maxscore:
-            self.status_img.setPixmap(Qt.QPixmap(common.WARNING))
+            self.status_img.setPixmap(common.pixmap(common.WARNING))
             self.status_label.setText('Сохраните')
             self.status_label.setStyleSheet('color: ' + common.YELLOW)
         else:
-            self.status_img.setPixmap(Qt.QPixmap(common.TICK))
+            self.status_img.setPixmap(common.pixmap(common.TICK))
             self.status_label.setText('Сохранено')
             self.status_label.setStyleSheet('color: ' + common.GREEN)
         if saved_correct != correct:
@@ -127,9 +133,17 @@ class QuestionShortEdit(ExamWidgetBase):
             self.maxscore_input.setStyleSheet('border-color: ' + common.GREEN)
         if len(maxscore) > 9 or not maxscore.isdigit() or int(maxscore) == 0:
             self.maxscore_input.setStyleSheet('border-color: ' + common.RED)
-            self.status_img.setPixmap(Qt.QPixmap(common.CROSS))
+            self.status_img.setPixmap(common.pixmap(common.CROSS))
             self.status_label.setText('Недопустимо')
             self.status_label.setStyleSheet('color: ' + common.RED)
             self.save_button.setDisabled(True)
         else:
             self.save_button.setEnabled(True)
+
+    def set_action_state(self, status, succeeded):
+        """
+        Shows result of the last action.
+        """
+        self.status_img.setPixmap(common.pixmap(common.TICK if succeeded else common.CROSS))
+        self.status_label.setText(status)
+        self.status_label.setStyleSheet('color: ' + (common.GREEN if succeeded else common.RED))
@@ -9,7 +9,7 @@ import common
 
 def get_sums(results_table):
     """
-    Returns results table sorted by sum.
+    Returns sums of scores of the results table rows.
     """
     cnt_rows = len(results_table)
     sums = [0] * cnt_rows
@@ -19,30 +19,116 @@ def get_sums(results_table):
     return sums
 
 
+def result_color(question_result):
+    """
+    Returns color of the result cell.
+    """
+    if question_result and question_result['share'] == -1:
+        return common.YELLOW
+    if question_result and question_result['share'] == 1:
+        return common.GREEN
+    if question_result and question_result['share'] > 0:
+        return common.LIME
+    return common.RED
+
+
+class ResultsModel(Qt.QAbstractTableModel):
+    """
+    Results table of the exam, cells are rendered by the view on demand.
+    Columns are user name, sum and questions.
+    """
+    def __init__(self, users, questions_ids, results_table):
+        super().__init__()
+        self.users = users
+        self.questions_ids = questions_ids
+        self.results_table = results_table
+        self.sums = get_sums(results_table)
+        self.order = list(range(len(users)))
+        self.font = common.font(20)
+        self.colors = {color: Qt.QColor(color) for color in (common.GREEN, common.LIME, common.RED, common.YELLOW)}
+
+    def rowCount(self, parent=Qt.QModelIndex()):
+        """
+        Returns number of users.
+        """
+        return 0 if parent.isValid() else len(self.users)
+
+    def columnCount(self, parent=Qt.QModelIndex()):
+        """
+        Returns number of questions with user name and sum columns.
+        """
+        return 0 if parent.isValid() else len(self.questions_ids) + 2
+
+    def cell(self, row, column):
+        """
+        Returns pair (user_id, question_id) of the cell or None if the cell has no result.
+        """
+        i = self.order[row]
+        if column < 2 or not self.results_table[i][column - 2]:
+            return None
+        return self.users[i]['rowid'], self.questions_ids[column - 2]
+
+    def data(self, index, role=Qt.Qt.DisplayRole):
+        """
+        Returns data of the cell for the role.
+        """
+        i, column = self.order[index.row()], index.column()
+        if role == Qt.Qt.DisplayRole:
+            if column == 0:
+                return self.users[i]['name']
+            if column == 1:
+                return str(self.sums[i])
+            question_result = self.results_table[i][column - 2]
+            return common.get_question_details(question_result)['score'] if question_result else ''
+        if role == Qt.Qt.ForegroundRole and column >= 2:
+            return self.colors[result_color(self.results_table[i][column - 2])]
+        if role == Qt.Qt.FontRole:
+            return self.font
+        if role == Qt.Qt.TextAlignmentRole:
+            return Qt.Qt.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.Qt.DisplayRole):
+        """
+        Returns column titles.
+        """
+        if orientation != Qt.Qt.Horizontal:
+            return None
+        if role == Qt.Qt.DisplayRole:
+            return ('Участник', 'Σ')[section] if section < 2 else str(section - 1)
+        if role == Qt.Qt.FontRole:
+            return self.font
+        return None
+
+    def sort(self, column, order=Qt.Qt.AscendingOrder):
+        """
+        Sorts users by the column.
+        """
+        if column == 0:
+            key = lambda i: self.users[i]['name']
+        elif column == 1:
+            key = lambda i: self.sums[i]
+        else:
+            key = lambda i: (
+                self.results_table[i][column - 2]['score']
+                if self.results_table[i][column - 2] else -1)
+        self.layoutAboutToBeChanged.emit()
+        self.order.sort(key=key, reverse=order == Qt.Qt.DescendingOrder)
+        self.layoutChanged.emit()
+
+
 class ResultsPage(Qt.QWidget):
     """
     Page to display the results table of the exam.
     """
+    @common.timed
     def __init__(self, app, exam_id, users, questions_ids, results_table):
         super().__init__()
-        cnt_rows, cnt_columns = len(users), len(questions_ids)
-        sums = get_sums(results_table)
-        order = sorted([i for i in range(cnt_rows)], key=lambda i: sums[i], reverse=True)
-        users = [users[i] for i in order]
-        sums = [sums[i] for i in order]
-        questions_ids = questions_ids
-        results_table = [results_table[i] for i in order]
-        style_str = (
-            'padding-left: 15px;'
-            'padding-right: 15px;'
-            'padding-top: 10px;'
-            'padding-bottom: 10px;'
-            'border-radius: 0px;'
-            'border-bottom: 1px solid grey;'
-            'border-right: 1px solid grey;'
-        )
-
-        back_button = Qt.QPushButton(Qt.QIcon(common.LEFT), '', self)
+        self.app = app
+        self.exam_id = exam_id
+        self.model = ResultsModel(users, questions_ids, results_table)
+
+        back_button = Qt.QPushButton(common.icon(common.LEFT), '', self)
         back_button.setObjectName('Flat')
         back_button.setCursor(Qt.Qt.PointingHandCursor)
         back_button.setIconSize(Qt.QSize(35, 35))
@@ -50,76 +136,39 @@ class ResultsPage(Qt.QWidget):
         back_button.clicked.connect(lambda: app.display_exam(exam_id))
 
         results_title = Qt.QLabel('Таблица результатов', self)
-        results_title.setFont(Qt.QFont('Arial', 30))
+        results_title.setFont(common.font(30))
 
-        update_button = Qt.QPushButton(Qt.QIcon(common.UPDATE), '', self)
+        update_button = Qt.QPushButton(common.icon(common.UPDATE), '', self)
         update_button.setObjectName('Flat')
         update_button.setCursor(Qt.Qt.PointingHandCursor)
         update_button.setIconSize(Qt.QSize(35, 35))
         update_button.setFixedSize(Qt.QSize(55, 55))
         update_button.clicked.connect(lambda: app.display_results_page(exam_id))
 
-        scroll_area = Qt.QScrollArea()
-        scroll_area.setFrameShape(Qt.QFrame.NoFrame)
-
-        grid_layout = Qt.QGridLayout()
-        grid_layout.setSpacing(0)
-
-        user_column = Qt.QLabel('Участник', self)
-        user_column.setFont(Qt.QFont('Arial', 20))
-        user_column.setAlignment(Qt.Qt.AlignCenter)
-        user_column.setStyleSheet(style_str)
-        grid_layout.addWidget(user_column, 0, 0)
-
-        sum_column = Qt.QLabel('Σ', self)
-        sum_column.setFont(Qt.QFont('Arial', 20))
-        sum_column.setAlignment(Qt.Qt.AlignCenter)
-        sum_column.setStyleSheet(style_str)
-        grid_layout.addWidget(sum_column, 0, 1)
-
-        for j in range(cnt_columns):
-            question_column = Qt.QLabel(str(j + 1), self)
-            question_column.setFont(Qt.QFont('Arial', 20))
-            question_column.setAlignment(Qt.Qt.AlignCenter)
-            question_column.setStyleSheet(style_str)
-            grid_layout.addWidget(question_column, 0, j + 2)
-
-        for i in range(cnt_rows):
-            user_row = Qt.QLabel(users[i]['name'], self)
-            user_row.setFont(Qt.QFont('Arial', 20))
-            user_row.setAlignment(Qt.Qt.AlignCenter)
-            user_row.setStyleSheet(style_str)
-            grid_layout.addWidget(user_row, i + 1, 0)
-
-            sum_cell = Qt.QLabel(str(sums[i]), self)
-            sum_cell.setFont(Qt.QFont('Arial', 20))
-            sum_cell.setAlignment(Qt.Qt.AlignCenter)
-            sum_cell.setStyleSheet(style_str)
-            grid_layout.addWidget(sum_cell, i + 1, 1)
-
-        for i in range(cnt_rows):
-            for j in range(cnt_columns):
-                question_details = common.get_question_details(results_table[i][j])
-                question_style = common.main_question_style(results_table[i][j])
-
-                if not results_table[i][j]:
-                    cell = Qt.QLabel(' ', self)
-                    cell.setFont(Qt.QFont('Arial', 20))
-                    cell.setStyleSheet(style_str)
-                else:
-                    cell = Qt.QPushButton(question_details['score'], self)
-                    cell.setObjectName('Flat')
-                    cell.setFont(Qt.QFont('Arial', 20))
-                    cell.setStyleSheet(style_str + 'color: ' + question_style['main_color'])
-                    cell.setCursor(Qt.Qt.PointingHandCursor)
-                    cell.clicked.connect(common.return_lambda(
-                        app.display_student_answer_page,
-                        exam_id, questions_ids[j], users[i]['rowid']))
-                grid_layout.addWidget(cell, i + 1, j + 2)
-
-        scroll_widget = Qt.QWidget(self)
-        scroll_widget.setLayout(grid_layout)
-        scroll_area.setWidget(scroll_widget)
+        answers_checkbox = Qt.QCheckBox('С ответами', self)
+        answers_checkbox.setFont(common.font(20))
+
+        export_button = Qt.QPushButton(common.icon(common.SAVE), 'Экспорт', self)
+        export_button.setObjectName('Button')
+        export_button.setIconSize(Qt.QSize(35, 35))
+        export_button.setFont(common.font(20))
+        export_button.clicked.connect(
+            lambda: app.export_results(exam_id, answers_checkbox.isChecked()))
+
+        self.export_label = Qt.QLabel(self)
+        self.export_label.setFont(common.font(20))
+
+        table_view = Qt.QTableView(self)
+        table_view.setModel(self.model)
+        table_view.setSortingEnabled(True)
+        table_view.sortByColumn(1, Qt.Qt.DescendingOrder)
+        table_view.setSelectionMode(Qt.QAbstractItemView.NoSelection)
+        table_view.setEditTriggers(Qt.QAbstractItemView.NoEditTriggers)
+        table_view.verticalHeader().hide()
+        table_view.verticalHeader().setDefaultSectionSize(45)
+        table_view.horizontalHeader().setDefaultSectionSize(80)
+        table_view.setColumnWidth(0, 250)
+        table_view.clicked.connect(self.open_cell)
 
         upper_layout = Qt.QHBoxLayout()
         upper_layout.addWidget(back_button)
@@ -128,8 +177,33 @@ class ResultsPage(Qt.QWidget):
         upper_layout.addStretch(1)
         upper_layout.addWidget(update_button)
 
+        lower_layout = Qt.QHBoxLayout()
+        lower_layout.addWidget(export_button)
+        lower_layout.addSpacerItem(Qt.QSpacerItem(20, 0))
+        lower_layout.addWidget(answers_checkbox)
+        lower_layout.addSpacerItem(Qt.QSpacerItem(20, 0))
+        lower_layout.addWidget(self.export_label)
+        lower_layout.addStretch(1)
+
         layout = Qt.QVBoxLayout()
         layout.addLayout(upper_layout)
         layout.addSpacerItem(Qt.QSpacerItem(0, 40))
-        layout.addWidget(scroll_area)
+        layout.addWidget(table_view)
+        layout.addSpacerItem(Qt.QSpacerItem(0, 10))
+        layout.addLayout(lower_layout)
         self.setLayout(layout)
+
+    def open_cell(self, index):
+        """
+        Displays student's answer for the clicked cell.
+        """
+        cell = self.model.cell(index.row(), index.column())
+        if cell is not None:
+            self.app.display_student_answer_page(self.exam_id, cell[1], cell[0])
+
+    def set_export_state(self, status, succeeded):
+        """
+        Shows result of exporting the results table.
+        """
+        self.export_label.setText(status)
+        self.export_label.setStyleSheet('color: ' + (common.GREEN if succeeded else common.RED))
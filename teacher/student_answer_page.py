@@ -10,13 +10,14 @@ import common
 class StudentAnswerPage(Qt.QWidget):
     """
     Page to display student's answer for the question.
+    Score can't be changed if the exam is archived.
     """
-    def __init__(self, app, exam_id, question_data, question_result):
+    def __init__(self, app, exam_id, question_data, question_result, archived):
         super().__init__()
         self.question_data = question_data
         self.question_details = common.get_question_details(question_result)
 
-        back_button = Qt.QPushButton(Qt.QIcon(common.LEFT), '', self)
+        back_button = Qt.QPushButton(common.icon(common.LEFT), '', self)
         back_button.setObjectName('Flat')
         back_button.setCursor(Qt.Qt.PointingHandCursor)
         back_button.setIconSize(Qt.QSize(35, 35))
@@ -24,39 +25,39 @@ class StudentAnswerPage(Qt.QWidget):
         back_button.clicked.connect(lambda: app.display_results_page(exam_id))
 
         check_title = Qt.QLabel('Результаты проверки', self)
-        check_title.setFont(Qt.QFont('Arial', 30))
+        check_title.setFont(common.font(30))
 
         scroll_area = Qt.QScrollArea()
         scroll_area.setWidgetResizable(True)
         scroll_area.setFrameShape(Qt.QFrame.NoFrame)
 
         statement_title = Qt.QLabel('Текст вопроса:', self)
-        statement_title.setFont(Qt.QFont('Arial', 25))
+        statement_title.setFont(common.font(25))
 
         statement_label = Qt.QLabel(self.question_data['statement'], self)
-        statement_label.setFont(Qt.QFont('Arial', 20))
+        statement_label.setFont(common.font(20))
         statement_label.setWordWrap(True)
 
         answer_title = Qt.QLabel('Ответ участника:', self)
-        answer_title.setFont(Qt.QFont('Arial', 25))
+        answer_title.setFont(common.font(25))
 
         answer_label = Qt.QLabel(self.question_details['answer'], self)
-        answer_label.setFont(Qt.QFont('Arial', 20))
+        answer_label.setFont(common.font(20))
         answer_label.setWordWrap(True)
 
         self.save_button = Qt.QPushButton('Сохранить', self)
         self.save_button.setObjectName('Button')
-        self.save_button.setFont(Qt.QFont('Arial', 20))
+        self.save_button.setFont(common.font(20))
         self.save_button.clicked.connect(lambda: app.save_submission_score(
             exam_id, self.question_data['rowid'],
             question_result['rowid'], self.score_input.text()
         ))
 
         score_title = Qt.QLabel('Баллы (из ' + str(self.question_data['maxscore']) + '):', self)
-        score_title.setFont(Qt.QFont('Arial', 20))
+        score_title.setFont(common.font(20))
 
         self.score_input = Qt.QLineEdit(self.question_details['score'], self)
-        self.score_input.setFont(Qt.QFont('Arial', 20))
+        self.score_input.setFont(common.font(20))
         self.score_input.setMinimumWidth(200)
         self.score_input.textChanged.connect(self.update_status)
         self.score_input.returnPressed.connect(self.save_button.click)
@@ -66,9 +67,14 @@ class StudentAnswerPage(Qt.QWidget):
         self.status_img.setFixedSize(Qt.QSize(50, 50))
 
         self.status_label = Qt.QLabel(self)
-        self.status_label.setFont(Qt.QFont('Arial', 20))
+        self.status_label.setFont(common.font(20))
         self.update_status()
 
+        if archived:
+            check_title.setText('Результаты проверки (экзамен в архиве)')
+            for widget in (self.score_input, self.save_button):
+                widget.setDisabled(True)
+
         upper_layout = Qt.QHBoxLayout()
         upper_layout.addWidget(back_button)
         upper_layout.addStretch(1)
@@ -125,17 +131,25 @@ class StudentAnswerPage(Qt.QWidget):
         saved_score = self.question_details['score']
         maxscore = self.question_data['maxscore']
         if saved_score != score:
-            self.status_img.setPixmap(Qt.QPixmap(common.WARNING))
+            self.status_img.setPixmap(common.pixmap(common.WARNING))
             self.status_label.setText('Сохраните')
             self.status_label.setStyleSheet('color: ' + common.YELLOW)
         else:
-            self.status_img.setPixmap(Qt.QPixmap(common.TICK))
+            self.status_img.setPixmap(common.pixmap(common.TICK))
             self.status_label.setText('Сохранено')
             self.status_label.setStyleSheet('color: ' + common.GREEN)
         if score != '?' and (not score.isdigit() or not int(score) <= maxscore):
-            self.status_img.setPixmap(Qt.QPixmap(common.CROSS))
+            self.status_img.setPixmap(common.pixmap(common.CROSS))
             self.status_label.setText('Недопустимо')
             self.status_label.setStyleSheet('color: ' + common.RED)
             self.save_button.setDisabled(True)
         else:
             self.save_button.setEnabled(True)
+
+    def set_action_state(self, status, succeeded):
+        """
+        Shows result of the last action.
+        """
+        self.status_img.setPixmap(common.pixmap(common.TICK if succeeded else common.CROSS))
+        self.status_label.setText(status)
+        self.status_label.setStyleSheet('color: ' + (common.GREEN if succeeded else common.RED))
@@ -3,40 +3,21 @@ Examiner project, teacher module.
 """
 
 
+from time import perf_counter
+STARTED = perf_counter()
+
+import csv
 import sys
+import json
 import socket
-import functools
 
 from PyQt5 import Qt
 from client import Client
-from settings_page import SettingsPage
+from rpc import AsyncServer
+from transport import is_invalid_session
 from login_page import LoginPage
-from register_page import RegisterPage
-from new_group_page import NewGroupPage
-from home_page import HomePage
-from profile_page import ProfilePage
-from confirm_page import ConfirmPage
-from error_widget import ErrorWidget
-from exam_page import ExamPage
-from exam_settings import ExamSettings
-from question_short import QuestionShortEdit
-from question_long import QuestionLongEdit
-from results_page import ResultsPage
-from student_answer_page import StudentAnswerPage
-
-
-def safe(function):
-    """
-    Returns safe function.
-    """
-    @functools.wraps(function)
-    def result(self, *args, **kwargs):
-        try:
-            return function(self, *args, **kwargs)
-        except socket.error:
-            self.display_settings_page()
-            self.widget.set_failed_state()
-    return result
+import common
+IMPORTED = perf_counter()
 
 
 class Application(Qt.QApplication):
@@ -46,25 +27,57 @@ class Application(Qt.QApplication):
     def __init__(self):
         super().__init__(sys.argv)
         self.client = Client()
+        self.rpc = AsyncServer(self.client.thread_server)
+        self.navigation = 0
+        self.loading = 0
         self.window = Qt.QWidget()
-        self.window.setStyleSheet(open('client//style.css').read())
         self.window.setWindowTitle('Teacher')
         self.window.setGeometry(200, 100, 1000, 700)
         self.widget = Qt.QWidget(self.window)
-        self.layout = Qt.QHBoxLayout(self.window)
+        self.loading_label = Qt.QLabel('Загрузка...', self.window)
+        self.loading_label.setFont(common.font(15))
+        self.loading_label.hide()
+        self.rpc.signals.reconnecting.connect(
+            lambda: self.loading_label.setText('Переподключение...'))
+        self.client.on_retry = self.rpc.signals.reconnecting.emit
+        self.settings_watcher = Qt.QFileSystemWatcher([self.client.path])
+        self.settings_watcher.fileChanged.connect(self.settings_changed)
+        self.layout = Qt.QVBoxLayout(self.window)
         self.layout.addWidget(self.widget)
+        self.layout.addWidget(self.loading_label)
+        if common.TIMING:
+            self.window.installEventFilter(self)
         self.window.show()
+        Qt.QTimer.singleShot(0, self.load_style)
 
     def display_widget(self, widget):
         """
         Displays the widget.
         """
+        self.navigation += 1
         old = self.widget
         old.deleteLater()
         self.layout.removeWidget(old)
-        self.layout.addWidget(widget)
+        self.layout.insertWidget(0, widget)
         self.widget = widget
 
+    def load_style(self):
+        """
+        Loads style sheet of the window after the first paint.
+        """
+        with open('client//style.css', encoding='utf-8') as file:
+            self.window.setStyleSheet(file.read())
+
+    def eventFilter(self, watched, event):
+        """
+        Reports time of the first paint of the window in timing mode.
+        """
+        if watched is self.window and event.type() == Qt.QEvent.Paint:
+            self.window.removeEventFilter(self)
+            print('imports: %.1f ms' % ((IMPORTED - STARTED) * 1000))
+            print('first paint: %.1f ms' % ((perf_counter() - STARTED) * 1000))
+        return False
+
     def start(self):
         """
         Starts application.
@@ -72,30 +85,141 @@ class Application(Qt.QApplication):
         self.display_login_page()
         self.exit(self.exec_())
 
+    def set_loading(self, delta):
+        """
+        Shows loading state while there are unfinished requests.
+        """
+        self.loading += delta
+        if self.loading == 0 or self.loading == delta:
+            self.loading_label.setText('Загрузка...')
+        self.loading_label.setVisible(self.loading > 0)
+        self.window.setCursor(Qt.Qt.BusyCursor if self.loading > 0 else Qt.Qt.ArrowCursor)
+
+    def request(self, calls, on_finished, on_failed=None, navigate=True, relogin=True):
+        """
+        Runs server calls (pairs of method and args) in background, cached results are reused.
+        Results are passed to on_finished only if no other page was requested meanwhile,
+        results of background requests (not navigate) - if the page is still displayed.
+        If the server lost the session, the user is logged in again and the calls are repeated.
+        """
+        if navigate:
+            self.navigation += 1
+        navigation = self.navigation
+        page = self.widget
+
+        def is_actual():
+            if navigate:
+                return navigation == self.navigation
+            return self.widget is page
+        cache_version = self.client.cache_version
+        results = [None] * len(calls)
+        missing = []
+        for index, (method, args) in enumerate(calls):
+            found, results[index] = self.client.get_cached(method, args)
+            if not found:
+                missing.append(index)
+        if not missing:
+            on_finished(*results)
+            return
+
+        def finished(fetched):
+            self.set_loading(-1)
+            for index, result in zip(missing, fetched):
+                results[index] = result
+                if cache_version == self.client.cache_version:
+                    self.client.set_cached(*calls[index], result)
+            if is_actual():
+                on_finished(*results)
+
+        def failed(error):
+            self.set_loading(-1)
+            if not is_actual():
+                return
+            if relogin and is_invalid_session(error) and self.client.user:
+                token = self.client.user['token']
+                self.relogin(token, lambda new_token: self.request(
+                    [(method, tuple(new_token if arg == token else arg for arg in args))
+                     for method, args in calls],
+                    on_finished, on_failed, navigate, relogin=False), on_failed)
+                return
+            (on_failed or self.connection_failed)(error)
+
+        self.set_loading(1)
+        self.rpc.request([calls[index] for index in missing], finished, failed)
+
+    def relogin(self, token, on_finished, on_failed=None):
+        """
+        Logs in again with saved user name and password after the server lost the session with token.
+        New token is passed to on_finished, the login page is displayed if login fails.
+        """
+        def finished(results):
+            self.set_loading(-1)
+            if not results[0][0]:
+                self.client.user = False
+                self.display_login_page()
+                return
+            self.client.user = results[0][1]
+            on_finished(self.client.user['token'])
+
+        def failed(error):
+            self.set_loading(-1)
+            (on_failed or self.connection_failed)(error)
+
+        if self.client.user and self.client.user['token'] != token:
+            on_finished(self.client.user['token'])
+            return
+        password_hash = self.client.encode_password(self.client.password)
+        self.set_loading(1)
+        self.rpc.request(
+            [('login', (self.client.user_name, password_hash, 1))], finished, failed)
+
+    def connection_failed(self, error):
+        """
+        Displays settings page if the server is unavailable,
+        login page if the server does not know the session.
+        """
+        if is_invalid_session(error):
+            self.client.user = False
+            self.display_login_page()
+            return
+        if not isinstance(error, socket.error):
+            raise error
+        self.display_settings_page()
+        self.widget.set_failed_state()
+
     def check_ip(self, ip_address):
         """
         Checks ip-address of server.
         """
-        try:
-            self.widget.set_waiting_state()
-            self.client.update_data({'server': ip_address})
-            self.client.update_server()
-            self.client.server.ping()
-            self.widget.set_succeeded_state()
-        except socket.error:
-            self.widget.set_failed_state()
+        self.widget.set_waiting_state()
+        self.client.update_data({'server': ip_address})
+        self.client.update_server()
+        self.request(
+            [('ping', ())],
+            lambda _: self.widget.set_succeeded_state(),
+            lambda _: self.widget.set_failed_state(),
+            navigate=False)
+
+    def settings_changed(self, path):
+        """
+        Applies settings edited by another program.
+        """
+        if path not in self.settings_watcher.files():
+            self.settings_watcher.addPath(path)
+        self.client.reload_data()
 
     def save_settings(self, settings):
         """
         Saves all settings.
         """
-        self.client.set_data(settings)
+        self.client.update_data(settings)
         self.display_login_page()
 
     def display_settings_page(self):
         """
         Displays settings page.
         """
+        from settings_page import SettingsPage
         self.display_widget(SettingsPage(self))
 
     def display_login_page(self):
@@ -108,170 +232,331 @@ class Application(Qt.QApplication):
         """
         Displays register page for teacher.
         """
+        from register_page import RegisterPage
         self.display_widget(RegisterPage(self))
 
     def display_new_group_page(self):
         """
         Displays page for creating new group.
         """
+        from new_group_page import NewGroupPage
         self.display_widget(NewGroupPage(self))
 
-    @safe
     def create_group(self, group_name):
         """
         Creates the group.
         """
+        def finished(result):
+            if not result[0]:
+                self.widget.set_failed_state(result[1])
+            else:
+                self.display_register_page()
+
         self.widget.set_waiting_state()
-        result = self.client.server.create_group(group_name)
-        if not result[0]:
-            self.widget.set_failed_state(result[1])
-        else:
-            self.display_register_page()
+        self.request([('create_group', (group_name,))], finished)
 
-    @safe
     def register(self, group_name, user_name, password):
         """
         Tries to register the teacher.
         """
+        def finished(result):
+            if not result[0]:
+                self.widget.set_failed_state(result[1])
+            else:
+                self.client.user_name = user_name
+                self.client.password = password
+                self.display_login_page()
+
         self.widget.set_waiting_state()
         password_hash = self.client.encode_password(password)
-        result = self.client.server.register(user_name, password_hash, 1, group_name)
-        if not result[0]:
-            self.widget.set_failed_state(result[1])
-        else:
-            self.client.user_name = user_name
-            self.client.password = password
-            self.display_login_page()
+        self.request([('register', (user_name, password_hash, 1, group_name))], finished)
 
-    @safe
     def login(self, user_name, password):
         """
         Tries to login the teacher.
         """
+        def finished(result):
+            if not result[0]:
+                self.client.user = False
+                self.widget.set_failed_state(result[1])
+            else:
+                self.client.user = result[1]
+                self.client.invalidate()
+                self.display_home_page()
+
         self.widget.set_waiting_state()
         self.client.user_name = user_name
         self.client.password = password
         password_hash = self.client.encode_password(password)
-        result = self.client.server.login(user_name, password_hash, 1)
-        if not result[0]:
-            self.client.user = False
-            self.widget.set_failed_state(result[1])
-        else:
-            self.client.user = result[1]
-            self.display_home_page()
+        self.request([('login', (user_name, password_hash, 1))], finished)
 
-    @safe
     def logout(self):
         """
         Logs out the teacher.
         """
+        if self.client.user:
+            self.rpc.request(
+                [('logout', (self.client.user['token'],))], lambda _: None, lambda _: None)
         self.client.user = False
+        self.client.invalidate()
         self.display_login_page()
 
-    @safe
     def change_password(self, old_password, new_password):
         """
         Changes password of current user.
         """
+        def finished(result):
+            if not result[0]:
+                self.widget.set_failed_state(result[1])
+            else:
+                self.client.password = new_password
+                self.logout()
+
         self.widget.set_waiting_state()
         old_password_hash = self.client.encode_password(old_password)
         new_password_hash = self.client.encode_password(new_password)
-        result = self.client.server.change_password(
-            self.client.user['rowid'], old_password_hash, new_password_hash)
-        if not result[0]:
-            self.widget.set_failed_state(result[1])
-        else:
-            self.client.password = new_password
-            self.logout()
+        self.request([(
+            'change_password',
+            (self.client.user['token'], old_password_hash, new_password_hash)
+        )], finished)
 
-    def current_group_name(self):
+    def display_import_page(self):
         """
-        Returns group name of current user.
+        Displays page for importing students.
         """
-        return self.client.server.get_group_data(self.client.user['group_id'])['name']
+        from import_page import ImportPage
+        self.display_widget(ImportPage(self))
 
-    def list_of_exams(self):
+    def import_students(self):
         """
-        Returns list of exams.
+        Registers students from CSV file chosen by the user in the group of current user.
         """
-        return self.client.server.list_of_all_exams(self.client.user['group_id'])
-
-    @safe
-    def display_home_page(self):
+        path = Qt.QFileDialog.getOpenFileName(
+            self.window, 'Импорт учеников', '', 'CSV (*.csv *.txt)')[0]
+        if not path:
+            return
+        self.widget.set_waiting_state()
+        try:
+            with open(path, encoding='utf-8-sig', newline='') as file:
+                text = file.read()
+        except (OSError, UnicodeDecodeError):
+            self.widget.set_failed_state('Не удалось прочитать файл')
+            return
+        delimiter = ';'
+        try:
+            delimiter = csv.Sniffer().sniff(text[:1024], delimiters=';,\t').delimiter
+        except csv.Error:
+            pass
+        users = []
+        lines = []
+        conflicts = []
+        for line, row in enumerate(csv.reader(text.splitlines(), delimiter=delimiter), 1):
+            if not row:
+                continue
+            if len(row) != 2:
+                conflicts.append('Строка ' + str(line) + ': ожидались логин и пароль')
+                continue
+            users.append([row[0].strip(), self.client.encode_password(row[1].strip())])
+            lines.append(line)
+
+        def registered(result):
+            if not result[0]:
+                self.widget.set_failed_state(result[1])
+                return
+            for index, message in result[1]:
+                conflicts.append('Строка ' + str(lines[index]) + ': ' + message)
+            self.widget.set_succeeded_state(
+                'Добавлено учеников - ' + str(len(users) - len(result[1])), conflicts)
+
+        self.request(
+            [('get_group_data', (self.client.user['group_id'],))],
+            lambda group_data: self.request(
+                [('register_many', (users, 0, group_data['name'], self.client.user['token']))],
+                registered))
+
+    def display_home_page(self, name_filter=''):
         """
         Displays home page with list of exams.
         """
-        group_name = self.current_group_name()
-        list_of_exams = self.list_of_exams()
-        self.display_widget(HomePage(self, group_name, list_of_exams))
+        from home_page import HomePage
+        group_id = self.client.user['group_id']
+        self.request([
+            ('get_group_data', (group_id,)),
+            ('get_exams_page', (group_id, False, 0, common.EXAMS_PAGE_SIZE, name_filter))
+        ], lambda group_data, exams_page: self.display_widget(
+            HomePage(self, group_data['name'], exams_page, name_filter)))
+
+    def update_home_page(self, name_filter):
+        """
+        Displays home page with fresh list of exams.
+        """
+        self.client.invalidate('get_exams_page')
+        self.display_home_page(name_filter)
+
+    def load_more_exams(self, cursor):
+        """
+        Loads next page of exams on the home page.
+        """
+        self.request([(
+            'get_exams_page',
+            (self.client.user['group_id'], False, cursor,
+             common.EXAMS_PAGE_SIZE, self.widget.name_filter)
+        )], self.widget.extend, navigate=False)
 
-    @safe
     def display_profile_page(self):
         """
         Displays user profile.
         """
-        group_name = self.current_group_name()
+        from profile_page import ProfilePage
         user_name = self.client.user['name']
-        self.display_widget(ProfilePage(self, group_name, user_name))
+        self.request(
+            [('get_group_data', (self.client.user['group_id'],))],
+            lambda group_data: self.display_widget(
+                ProfilePage(self, group_data['name'], user_name)))
 
-    @safe
-    def display_exam(self, exam_id):
+    def display_exam(self, exam_id, action_status=None):
         """
-        Displays the exam.
+        Displays the exam, action_status is shown as error of the last action.
         """
+        from exam_page import ExamPage
         self.display_widget(ExamPage(self, exam_id))
-        self.view_exam_settings()
+        self.view_exam_settings(action_status)
 
-    @safe
     def create_exam(self):
         """
         Creates the exam.
         """
-        exam_id = self.client.server.create_exam(self.client.user['group_id'])
-        self.display_exam(exam_id)
+        self.client.invalidate('get_exams_page')
+        self.request(
+            [('create_exam', (self.client.user['group_id'], self.client.user['token']))],
+            self.display_exam)
 
-    @safe
     def delete_exam(self, exam_id):
         """
         Deletes the exam.
         """
-        self.client.server.delete_exam(exam_id)
-        self.display_home_page()
+        self.client.invalidate('get_exams_page')
+        self.request(
+            [('delete_exam', (exam_id, self.client.user['token']))],
+            lambda _: self.display_home_page())
+
+    def clone_exam(self, exam_id, group_name):
+        """
+        Copies the exam to the group and opens the copy if it is in the current group.
+        """
+        def finished(result, group_data):
+            if not result[0]:
+                self.widget.widget.set_action_state(result[1], False)
+            elif group_name and group_name != group_data['name']:
+                self.widget.widget.set_action_state('Скопировано в группу ' + group_name, True)
+            else:
+                self.display_exam(result[1])
+
+        self.client.invalidate('get_exams_page')
+        self.request([
+            ('clone_exam', (exam_id, group_name, self.client.user['token'])),
+            ('get_group_data', (self.client.user['group_id'],))
+        ], finished)
+
+    def archive_exam(self, exam_id):
+        """
+        Moves the exam to the archive, ids of its questions change.
+        """
+        self.client.invalidate('get_questions_ids')
+        self.request(
+            [('archive_exam', (exam_id, self.client.user['token']))],
+            lambda result: self.display_exam(exam_id, None if result[0] else result[1]))
+
+    def export_exam(self, exam_id):
+        """
+        Saves the exam with all questions to JSON file chosen by the user.
+        """
+        def finished(bundle):
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump(bundle, file, ensure_ascii=False, indent=4)
+
+        path = Qt.QFileDialog.getSaveFileName(
+            self.window, 'Экспорт экзамена', 'exam.json', 'JSON (*.json)')[0]
+        if path:
+            self.request(
+                [('export_exam', (exam_id, self.client.user['token']))], finished, navigate=False)
+
+    def import_exam(self):
+        """
+        Creates the exam from JSON file chosen by the user.
+        """
+        def finished(result):
+            if not result[0]:
+                self.widget.set_failed_state(result[1])
+            else:
+                self.display_exam(result[1])
+
+        path = Qt.QFileDialog.getOpenFileName(
+            self.window, 'Импорт экзамена', '', 'JSON (*.json)')[0]
+        if not path:
+            return
+        try:
+            with open(path, encoding='utf-8') as file:
+                bundle = json.load(file)
+        except (OSError, ValueError):
+            self.widget.set_failed_state('Не удалось прочитать файл')
+            return
+        self.client.invalidate('get_exams_page')
+        self.request(
+            [('import_exam', (self.client.user['group_id'], bundle, self.client.user['token']))],
+            finished)
 
     def display_confirm_page(self, text, back_function, main_function):
         """
         Displays confirmation page.
         """
+        from confirm_page import ConfirmPage
         self.display_widget(ConfirmPage(text, back_function, main_function))
 
-    @safe
-    def view_exam_settings(self):
+    def view_exam_settings(self, action_status=None):
         """
         Displays exam settings.
         """
+        def finished(exam_data, questions_ids):
+            self.widget.question_id = None
+            self.widget.exam_data = exam_data
+            self.widget.questions_ids = questions_ids
+            self.widget.refresh()
+            self.widget.display_current_settings()
+            if action_status is not None:
+                self.widget.widget.set_action_state(action_status, False)
+
         exam_id = self.widget.exam_id
-        self.widget.question_id = None
-        self.widget.exam_data = self.client.server.get_exam_data(exam_id)
-        self.widget.questions_ids = self.client.server.get_questions_ids(exam_id)
-        self.widget.refresh()
-        self.widget.display_current_settings()
+        self.request([
+            ('get_exam_data', (exam_id, self.client.user['token'])),
+            ('get_questions_ids', (exam_id,))
+        ], finished)
 
-    @safe
-    def view_exam_question(self, question_id):
+    def view_exam_question(self, question_id, action_status=None):
         """
-        Displays selected question.
+        Displays selected question, action_status is shown as error of the last action.
         """
+        def finished(question_data, questions_ids):
+            self.widget.question_id = question_id
+            self.widget.question_data = question_data
+            self.widget.questions_ids = questions_ids
+            self.widget.refresh()
+            self.widget.display_current_question()
+            if action_status is not None and question_data:
+                self.widget.widget.set_action_state(action_status, False)
+
         exam_id = self.widget.exam_id
-        self.widget.question_id = question_id
-        self.widget.question_data = self.client.server.get_question_data(question_id)
-        self.widget.questions_ids = self.client.server.get_questions_ids(exam_id)
-        self.widget.refresh()
-        self.widget.display_current_question()
+        self.request([
+            ('get_question_data', (question_id,)),
+            ('get_questions_ids', (exam_id,))
+        ], finished)
 
     def get_settings_widget(self):
         """
         Returns the settings widget for the exam.
         """
+        from error_widget import ErrorWidget
+        from exam_settings import ExamSettings
         if not self.widget.exam_data:
             return ErrorWidget()
         return ExamSettings(self, self.widget)
@@ -280,6 +565,9 @@ class Application(Qt.QApplication):
         """
         Returns the question widget depending on it's type.
         """
+        from error_widget import ErrorWidget
+        from question_short import QuestionShortEdit
+        from question_long import QuestionLongEdit
         if not self.widget.question_data:
             return ErrorWidget()
         if self.widget.question_data['type'] == 'Short':
@@ -288,69 +576,152 @@ class Application(Qt.QApplication):
             return QuestionLongEdit(self, self.widget)
         return ErrorWidget()
 
-    @safe
     def create_question(self, exam_id, question_type):
         """
         Creates question with this type.
         """
-        question_id = self.client.server.create_question(exam_id, question_type)
-        self.view_exam_question(question_id)
+        def finished(question_id):
+            if question_id is False:
+                self.view_exam_settings('Не удалось создать вопрос')
+            else:
+                self.view_exam_question(question_id)
+
+        self.client.invalidate('get_questions_ids')
+        self.request(
+            [('create_question', (exam_id, question_type, self.client.user['token']))], finished)
 
-    @safe
     def delete_question(self, question_id):
         """
         Deletes question.
         """
-        self.client.server.delete_question(question_id)
-        self.view_exam_settings()
+        def finished(deleted):
+            if deleted:
+                self.view_exam_settings()
+            else:
+                self.view_exam_question(question_id, 'Не удалось удалить вопрос')
+
+        self.client.invalidate('get_questions_ids')
+        self.request([('delete_question', (question_id, self.client.user['token']))], finished)
 
-    @safe
     def save_exam_data(self, exam_data):
         """
         Saves exam's settings.
         """
-        self.client.server.set_exam_data(exam_data)
-        self.view_exam_settings()
-        self.widget.widget.update_status()
+        self.client.invalidate('get_exams_page')
+        self.request(
+            [('set_exam_data', (exam_data, self.client.user['token']))],
+            lambda _: self.view_exam_settings())
 
-    @safe
     def save_question_data(self, question_data):
         """
         Saves exam's question.
         """
         question_id = question_data['rowid']
-        self.client.server.set_question_data(question_data)
-        self.view_exam_question(question_id)
-        self.widget.widget.update_status()
+        self.request(
+            [('set_question_data', (question_data, self.client.user['token']))],
+            lambda saved: self.view_exam_question(
+                question_id, None if saved else 'Не удалось сохранить вопрос'))
 
-    @safe
     def display_results_page(self, exam_id):
         """
         Displays results table of the exam.
         """
-        users = self.client.server.get_users_by_exam(exam_id)
-        questions_ids = self.client.server.get_questions_ids(exam_id)
-        results_table = self.client.server.get_results_table(exam_id)
-        self.display_widget(ResultsPage(self, exam_id, users, questions_ids, results_table))
+        from results_page import ResultsPage
+        self.request([
+            ('get_users_by_exam', (exam_id, self.client.user['token'])),
+            ('get_questions_ids', (exam_id,)),
+            ('get_results_table', (exam_id, self.client.user['token']))
+        ], lambda users, questions_ids, results_table: self.display_widget(
+            ResultsPage(self, exam_id, users, questions_ids, results_table)))
+
+    def export_results(self, exam_id, with_answers):
+        """
+        Saves results table of the exam to CSV or TSV file chosen by the user.
+        The table is requested by chunks in background.
+        """
+        path = Qt.QFileDialog.getSaveFileName(
+            self.window, 'Экспорт результатов', 'results.csv', 'CSV (*.csv);;TSV (*.tsv)')[0]
+        if not path:
+            return
+        delimiter = '\t' if path.endswith('.tsv') else ','
+        page = self.widget
+        try:
+            file = open(path, 'w', encoding='utf-8-sig', newline='')
+        except OSError:
+            page.set_export_state('Не удалось создать файл', False)
+            return
+
+        def set_state(status, succeeded):
+            if self.widget is page:
+                page.set_export_state(status, succeeded)
+
+        def request_chunk(cursor):
+            self.set_loading(1)
+            self.rpc.request([(
+                'export_results',
+                (exam_id, with_answers, delimiter, cursor, common.EXPORT_CHUNK_SIZE,
+                 self.client.user['token'])
+            )], write_chunk, failed)
+
+        def write_chunk(results):
+            self.set_loading(-1)
+            try:
+                file.write(results[0]['data'])
+            except OSError:
+                file.close()
+                set_state('Не удалось записать файл', False)
+                return
+            if results[0]['cursor'] is False:
+                file.close()
+                set_state('Результаты сохранены', True)
+            else:
+                request_chunk(results[0]['cursor'])
+
+        def failed(error):
+            self.set_loading(-1)
+            file.close()
+            self.connection_failed(error)
+
+        request_chunk(0)
 
-    @safe
     def display_student_answer_page(self, exam_id, question_id, user_id):
         """
         Page to display student's answer for the question.
         """
-        question_data = self.client.server.get_question_data(question_id)
-        question_result = self.client.server.get_question_result(question_id, user_id)
-        self.display_widget(StudentAnswerPage(self, exam_id, question_data, question_result))
+        from error_widget import ErrorWidget
+        from student_answer_page import StudentAnswerPage
+
+        def finished(question_data, question_result, exam_data):
+            if not question_data or not exam_data:
+                self.display_widget(ErrorWidget())
+            else:
+                self.display_widget(StudentAnswerPage(
+                    self, exam_id, question_data, question_result, exam_data['archived']))
+
+        self.request([
+            ('get_question_data', (question_id,)),
+            ('get_question_result', (question_id, user_id, self.client.user['token'])),
+            ('get_exam_data', (exam_id, self.client.user['token']))
+        ], finished)
 
-    @safe
     def save_submission_score(self, exam_id, question_id, submission_id, score):
         """
-        Saves score (share) of the submission.
+        Saves score (share) of the submission, the page stays open if the server refused.
         """
-        question_data = self.client.server.get_question_data(question_id)
-        share = -1 if score == '?' else int(score) / question_data['maxscore']
-        self.client.server.save_submission_score(submission_id, share)
-        self.display_results_page(exam_id)
+        def save(question_data):
+            share = -1 if score == '?' else int(score) / question_data['maxscore']
+            self.request(
+                [('save_submission_score', (submission_id, share, self.client.user['token']))],
+                saved)
+
+        def saved(succeeded):
+            if succeeded:
+                self.display_results_page(exam_id)
+            elif self.widget is page:
+                page.set_action_state('Не удалось сохранить баллы', False)
+
+        page = self.widget
+        self.request([('get_question_data', (question_id,))], save)
 
 
 if __name__ == "__main__":
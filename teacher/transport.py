@@ -0,0 +1,156 @@
+"""
+Contains transport of server calls with timeouts, retries and circuit breaker.
+"""
+
+
+import time
+import random
+import socket
+import threading
+from xmlrpc.client import ServerProxy, Transport, Fault
+from jsonrpc_client import JSONServerProxy
+
+
+DEFAULT_TIMEOUT = 3
+TIMEOUTS = {
+    'get_results_table': 30,
+    'export_results': 30,
+    'register_many': 30,
+    'import_exam': 30,
+    'export_exam': 15,
+    'clone_exam': 15,
+    'archive_exam': 15
+}
+IDEMPOTENT = {
+    'ping', 'server_time', 'logout', 'finish_exam',
+    'get_group_data', 'list_of_published_exams', 'get_exams_page',
+    'get_exam_data', 'get_exam_data_student', 'get_questions_ids', 'get_question_data',
+    'get_questions_data', 'get_questions_results', 'get_question_result',
+    'get_users_by_exam', 'get_results_table',
+    'export_results', 'export_exam',
+    'set_exam_data', 'set_question_data', 'save_submission_score', 'delete_exam'
+}
+RETRIES = 3
+BACKOFF_BASE = 0.2
+BACKOFF_MAX = 2
+BREAKER_THRESHOLD = 5
+BREAKER_COOLDOWN = 10
+INVALID_SESSION = 2
+
+
+def is_idempotent(method, args):
+    """
+    Returns True if the call can be repeated without changing the result.
+    Submissions are idempotent if they have request key.
+    """
+    if method == 'add_submission':
+        return len(args) > 4 and bool(args[4])
+    return method in IDEMPOTENT
+
+
+def is_invalid_session(error):
+    """
+    Returns True if the error means that the server does not know the session,
+    for example after restart of the server.
+    """
+    return isinstance(error, Fault) and error.faultCode == INVALID_SESSION
+
+
+def backoff(attempt):
+    """
+    Returns delay before the next attempt, exponential with full jitter.
+    """
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+
+class TimeoutTransport(Transport):
+    """
+    XML-RPC transport with changeable timeout.
+    """
+    def __init__(self):
+        super().__init__()
+        self.timeout = DEFAULT_TIMEOUT
+
+    def make_connection(self, host):
+        """
+        Returns connection to the host with current timeout.
+        """
+        connection = super().make_connection(host)
+        connection.timeout = self.timeout
+        if connection.sock is not None:
+            connection.sock.settimeout(self.timeout)
+        return connection
+
+
+class CircuitBreaker:
+    """
+    Stops calls to the server for BREAKER_COOLDOWN seconds
+    after BREAKER_THRESHOLD failures in a row. Shared by all threads.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.failures = 0
+        self.opened = None
+
+    def check(self):
+        """
+        Raises ConnectionError if the breaker is open.
+        """
+        with self.lock:
+            if self.opened is not None and time.monotonic() - self.opened < BREAKER_COOLDOWN:
+                raise ConnectionError('Сервер недоступен')
+
+    def add_failure(self):
+        """
+        Counts the failed call.
+        """
+        with self.lock:
+            self.failures += 1
+            if self.failures >= BREAKER_THRESHOLD:
+                self.opened = time.monotonic()
+
+    def add_success(self):
+        """
+        Closes the breaker after the successful call.
+        """
+        with self.lock:
+            self.failures = 0
+            self.opened = None
+
+
+class ServerTransport:
+    """
+    Server proxy that calls functions with per-method timeouts
+    and retries idempotent calls after connection errors.
+    """
+    def __init__(self, address, protocol, breaker, on_retry):
+        self.transport = TimeoutTransport()
+        if protocol == 'json':
+            self.server = JSONServerProxy(address, self.transport)
+        else:
+            self.server = ServerProxy('http://' + address, transport=self.transport)
+        self.breaker = breaker
+        self.on_retry = on_retry
+
+    def __getattr__(self, name):
+        return lambda *args: self.call(name, args)
+
+    def call(self, method, args):
+        """
+        Calls method with args on the server.
+        """
+        self.transport.timeout = TIMEOUTS.get(method, DEFAULT_TIMEOUT)
+        attempts = RETRIES + 1 if is_idempotent(method, args) else 1
+        for attempt in range(attempts):
+            self.breaker.check()
+            try:
+                result = getattr(self.server, method)(*args)
+            except socket.error:
+                self.breaker.add_failure()
+                if attempt + 1 == attempts:
+                    raise
+                self.on_retry()
+                time.sleep(backoff(attempt))
+            else:
+                self.breaker.add_success()
+                return result